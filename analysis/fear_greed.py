@@ -25,8 +25,13 @@ import logging
 import time
 from typing import Optional
 
+import requests
+
 logger = logging.getLogger(__name__)
 
+# Keep-alive session shared by both index fetches
+_session = requests.Session()
+
 _CACHE_TTL = 4 * 3600  # 4-hour cache
 _cache: dict = {
     "stock": None,  "stock_exp": 0.0,
@@ -81,8 +86,7 @@ def _score_fg(fg_value: float) -> float:
 def _fetch_crypto_fg() -> Optional[tuple[float, str]]:
     """Fetch Crypto Fear & Greed from alternative.me (free, no auth)."""
     try:
-        import requests
-        resp = requests.get(
+        resp = _session.get(
             "https://api.alternative.me/fng/?limit=1",
             timeout=8,
         )
@@ -101,8 +105,7 @@ def _fetch_crypto_fg() -> Optional[tuple[float, str]]:
 def _fetch_stock_fg() -> Optional[tuple[float, str]]:
     """Fetch Stock Market Fear & Greed from CNN production API."""
     try:
-        import requests
-        resp = requests.get(
+        resp = _session.get(
             "https://production.dataviz.cnn.io/index/fearandgreed/graphdata",
             timeout=8,
             headers={"User-Agent": "Mozilla/5.0 (compatible; research-bot/1.0)"},
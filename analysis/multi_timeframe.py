@@ -12,7 +12,7 @@ Timeframe weights
 
 Public API
 ----------
-compute_mtf_signal(symbol, asset_type, daily_df) -> dict
+compute_mtf_signal(symbol, asset_type, daily_df, daily_signal=None) -> dict
 """
 
 import logging
@@ -77,14 +77,18 @@ def _fetch_intraday_stock(symbol: str) -> pd.DataFrame:
 # ── MTF signal ────────────────────────────────────────────────────────────────
 
 def compute_mtf_signal(symbol: str, asset_type: str,
-                       daily_df: pd.DataFrame) -> dict:
+                       daily_df: pd.DataFrame,
+                       daily_signal: Optional[dict] = None) -> dict:
     """Compute multi-timeframe confluence signal.
 
     Parameters
     ----------
-    symbol     : ticker string
-    asset_type : 'stock' or 'crypto'
-    daily_df   : existing daily OHLCV DataFrame (already fetched by scheduler)
+    symbol       : ticker string
+    asset_type   : 'stock' or 'crypto'
+    daily_df     : existing daily OHLCV DataFrame (already fetched by scheduler)
+    daily_signal : compute_technical_signal(daily_df) if the caller already
+                   has it; the 1D timeframe then reuses it instead of
+                   recomputing every indicator
 
     Returns
     -------
@@ -102,7 +106,8 @@ def compute_mtf_signal(symbol: str, asset_type: str,
     # ── 1D (always available) ──────────────────────────────────────────
     if daily_df is not None and not daily_df.empty and len(daily_df) >= 30:
         try:
-            tf_results["1D"] = compute_technical_signal(daily_df)
+            tf_results["1D"] = (daily_signal if daily_signal is not None
+                                else compute_technical_signal(daily_df))
         except Exception as exc:
             logger.debug("MTF 1D failed for %s: %s", symbol, exc)
 
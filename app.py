@@ -4,8 +4,11 @@ import streamlit as st
 from config import PAGE_ICON, PAGE_TITLE
 from i18n import t, language_selector
 from logger import setup_logging
+from db.database import ensure_schema, start_wal_checkpointer
 
 setup_logging()
+ensure_schema()
+start_wal_checkpointer()
 
 st.set_page_config(
     page_title=PAGE_TITLE,
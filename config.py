@@ -10,6 +10,8 @@ load_dotenv()
 BASE_DIR = Path(__file__).resolve().parent
 DB_PATH = BASE_DIR / "db" / "invest.db"
 MODELS_DIR = BASE_DIR / "models"
+# Bytes of the DB file SQLite may memory-map for reads (0 disables mmap)
+DB_MMAP_SIZE = int(os.getenv("DB_MMAP_SIZE", 256 * 1024 * 1024))
 LOG_DIR = "logs"
 
 # ── Logging ──────────────────────────────────────────────────────────
@@ -92,6 +94,7 @@ ML_PARAMS = {
 # ── Rate Limits ──────────────────────────────────────────────────────
 RATE_LIMITS = {
     "marketaux_per_day": 80,       # Conservative: 80/100 daily
+    "marketaux_articles_per_request": 3,  # Free tier returns at most 3 articles per call
     "finnhub_per_minute": 50,      # Conservative: 50/60 per minute
     "yfinance_per_minute": 30,     # No official limit, reasonable default
     "reddit_per_minute": 50,       # PRAW has built-in limiting, extra protection
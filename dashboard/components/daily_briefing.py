@@ -85,7 +85,8 @@ def get_daily_briefing() -> dict:
     # ── Paper position alerts (near stop-loss) ────────────────────────
     try:
         from db.models import get_paper_positions
-        positions = get_paper_positions("open")
+        positions = get_paper_positions(
+            "open", columns=("symbol", "entry_price", "stop_loss", "trailing_stop"))
         alerts = []
         for pos in positions:
             stop = max(pos.get("stop_loss") or 0, pos.get("trailing_stop") or 0)
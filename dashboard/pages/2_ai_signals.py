@@ -107,7 +107,7 @@ if generate:
         st.info("Checking multi-timeframe alignment...")
         try:
             _atype = "crypto" if asset_type == t("crypto") else "stock"
-            mtf_signal = compute_mtf_signal(symbol, _atype, df)
+            mtf_signal = compute_mtf_signal(symbol, _atype, df, daily_signal=tech_signal)
         except Exception:
             mtf_signal = None
 
@@ -173,7 +173,7 @@ st.dataframe(pd.DataFrame(limits), use_container_width=True, hide_index=True)
 # ── Risk Alerts ───────────────────────────────────────────────────────
 st.divider()
 st.subheader(t("risk_alerts"))
-alerts = get_risk_alerts(30)
+alerts = get_risk_alerts(30, as_dict=False)
 if alerts:
     for alert in alerts:
         severity_icon = {"critical": "🔴", "high": "🟠", "warning": "🟡", "info": "🔵"}.get(
@@ -69,6 +69,8 @@ with tab2:
             set_setting("telegram_bot_token", tg_token)
             set_setting("telegram_chat_id", tg_chat)
             set_setting("telegram_enabled", tg_enabled)
+            from data.notifier import invalidate_telegram_cache
+            invalidate_telegram_cache()
             st.success("Telegram settings saved.")
 
     if st.button("Send Test Message"):
@@ -885,14 +885,11 @@ Two signals appear:
 """)
 
 
-# ════════════════════════════════════════════════════════════════════════
-# Tab 6 — Common Mistakes
-# ════════════════════════════════════════════════════════════════════════
-with t6:
-    if _zh:
-        st.subheader("投資小白最常犯的錯誤")
-
-        mistakes = [
+@st.cache_resource
+def _mistakes(lang: str) -> tuple:
+    """Common-mistake (wrong, right, example) entries; built once per language."""
+    if lang == "zh":
+        return (
             (
                 "看到 BUY 就立刻買",
                 "同時確認 Confidence ≥ 65% + Strength ≥ 0.4，三個條件缺一不可",
@@ -933,7 +930,83 @@ with t6:
                 "每筆交易前必須設定止損價，最大接受虧損 ≤ 5% 總資金",
                 "小明買入某股票，心想「反正是長線，不用止損」。\n股票公司突然爆出負面消息，一天跌 40%。\n沒有止損的他，損失了 $8,000（8% 總資金）。\n✅ 正確：長線也需要止損，意外永遠來得突然。止損是保護本金的最後防線。",
             ),
-        ]
+        )
+    return (
+        (
+            "Buying immediately on every BUY signal",
+            "Confirm all three: Direction = BUY, Confidence ≥ 65%, Strength ≥ 0.4",
+            "TSLA shows BUY, but Strength=0.28 and Confidence=45%.\n"
+            "Bob ignores these numbers and buys immediately.\n"
+            "The signal reverses quickly — he loses 8% in 3 days.\n"
+            "✅ Correct: Always check the three numbers first. If any fails, skip.",
+        ),
+        (
+            "Relying only on technical signals, ignoring macro",
+            "Combine with Macro Regime, Market Breadth, and Sector — avoid trading against the trend",
+            "In early 2022, a stock shows a strong BUY signal (Strength=0.55).\n"
+            "But Macro Regime=BEAR and Market Breadth=POOR — the market has entered a bear trend.\n"
+            "Those who ignored the macro bought in and lost 35% as the market continued falling.\n"
+            "✅ Correct: Macro is the tide. Don't swim against it. Avoid longs in BEAR regime.",
+        ),
+        (
+            "Treating backtest returns as real returns",
+            "Backtests are historical references. Expect real results 30–40% lower due to slippage and emotions",
+            "Backtest shows AAPL annual return of +22%. Bob is excited.\n"
+            "But in real trading, fear makes him miss entries and greed makes him exit late.\n"
+            "His actual annual return is only +8%.\n"
+            "✅ Correct: Mentally discount backtest returns by 30–40% for a realistic expectation.",
+        ),
+        (
+            "Using the same position size for crypto and stocks",
+            "Crypto is 3–5× more volatile — use half the position size",
+            "Bob buys AAPL with 10% ($10,000) and BTC with 10% ($10,000).\n"
+            "BTC drops 25% in a week — loss of $2,500.\n"
+            "AAPL only drops 5% — loss of $500.\n"
+            "✅ Correct: BTC position should be 5% ($5,000) to keep max loss manageable.",
+        ),
+        (
+            "Frequent short-term trading",
+            "This system is designed for medium-to-long term. High frequency eats returns through commissions",
+            "Bob trades 3–5 times per day. Each trade costs 0.1% commission.\n"
+            "80 trades in a month = 8% in fees.\n"
+            "Strategy made 5%, but after fees: -3% net loss.\n"
+            "✅ Correct: Wait for quality signals. 3–5 trades per month is enough.",
+        ),
+        (
+            "Adding to a losing position after a stop is hit",
+            "Respect the stop-loss. Don't average down after it triggers",
+            "Bob buys MSFT @ $380, stop-loss at $365.\n"
+            "Price drops to $368. He thinks 'almost at my stop, it'll bounce' and doubles down.\n"
+            "Price continues to $340 — loss grows from $375 to $2,600.\n"
+            "✅ Correct: A stop is a stop. Exit calmly and wait for the next opportunity.",
+        ),
+        (
+            "Ignoring Risk Level = HIGH signals",
+            "HIGH risk means factors strongly disagree. Even if Direction=BUY, skip it",
+            "A symbol shows BUY, Strength=0.51, Confidence=67% — both pass thresholds.\n"
+            "But Risk Level=HIGH. Bob enters anyway.\n"
+            "The conflicting factors cause instability — the signal reverses in 3 days at a loss.\n"
+            "✅ Correct: Risk Level=HIGH is an additional warning. All metrics must pass, including this one.",
+        ),
+        (
+            "Entering without a stop-loss",
+            "Always set a stop-loss before entering. Max acceptable loss: ≤ 5% of capital",
+            "Bob buys a stock, thinking 'it's a long-term hold, I don't need a stop'.\n"
+            "The company releases shocking negative news — stock drops 40% in one day.\n"
+            "Without a stop, he loses $8,000 (8% of total capital).\n"
+            "✅ Correct: Even long-term positions need stops. Surprises always come without warning.",
+        ),
+    )
+
+
+# ════════════════════════════════════════════════════════════════════════
+# Tab 6 — Common Mistakes
+# ════════════════════════════════════════════════════════════════════════
+with t6:
+    if _zh:
+        st.subheader("投資小白最常犯的錯誤")
+
+        mistakes = _mistakes("zh")
 
         for i, (wrong, right, example) in enumerate(mistakes, 1):
             with st.expander(f"❌ 誤區 {i}：{wrong}"):
@@ -945,72 +1018,7 @@ with t6:
     else:
         st.subheader("Most Common Beginner Mistakes")
 
-        mistakes = [
-            (
-                "Buying immediately on every BUY signal",
-                "Confirm all three: Direction = BUY, Confidence ≥ 65%, Strength ≥ 0.4",
-                "TSLA shows BUY, but Strength=0.28 and Confidence=45%.\n"
-                "Bob ignores these numbers and buys immediately.\n"
-                "The signal reverses quickly — he loses 8% in 3 days.\n"
-                "✅ Correct: Always check the three numbers first. If any fails, skip.",
-            ),
-            (
-                "Relying only on technical signals, ignoring macro",
-                "Combine with Macro Regime, Market Breadth, and Sector — avoid trading against the trend",
-                "In early 2022, a stock shows a strong BUY signal (Strength=0.55).\n"
-                "But Macro Regime=BEAR and Market Breadth=POOR — the market has entered a bear trend.\n"
-                "Those who ignored the macro bought in and lost 35% as the market continued falling.\n"
-                "✅ Correct: Macro is the tide. Don't swim against it. Avoid longs in BEAR regime.",
-            ),
-            (
-                "Treating backtest returns as real returns",
-                "Backtests are historical references. Expect real results 30–40% lower due to slippage and emotions",
-                "Backtest shows AAPL annual return of +22%. Bob is excited.\n"
-                "But in real trading, fear makes him miss entries and greed makes him exit late.\n"
-                "His actual annual return is only +8%.\n"
-                "✅ Correct: Mentally discount backtest returns by 30–40% for a realistic expectation.",
-            ),
-            (
-                "Using the same position size for crypto and stocks",
-                "Crypto is 3–5× more volatile — use half the position size",
-                "Bob buys AAPL with 10% ($10,000) and BTC with 10% ($10,000).\n"
-                "BTC drops 25% in a week — loss of $2,500.\n"
-                "AAPL only drops 5% — loss of $500.\n"
-                "✅ Correct: BTC position should be 5% ($5,000) to keep max loss manageable.",
-            ),
-            (
-                "Frequent short-term trading",
-                "This system is designed for medium-to-long term. High frequency eats returns through commissions",
-                "Bob trades 3–5 times per day. Each trade costs 0.1% commission.\n"
-                "80 trades in a month = 8% in fees.\n"
-                "Strategy made 5%, but after fees: -3% net loss.\n"
-                "✅ Correct: Wait for quality signals. 3–5 trades per month is enough.",
-            ),
-            (
-                "Adding to a losing position after a stop is hit",
-                "Respect the stop-loss. Don't average down after it triggers",
-                "Bob buys MSFT @ $380, stop-loss at $365.\n"
-                "Price drops to $368. He thinks 'almost at my stop, it'll bounce' and doubles down.\n"
-                "Price continues to $340 — loss grows from $375 to $2,600.\n"
-                "✅ Correct: A stop is a stop. Exit calmly and wait for the next opportunity.",
-            ),
-            (
-                "Ignoring Risk Level = HIGH signals",
-                "HIGH risk means factors strongly disagree. Even if Direction=BUY, skip it",
-                "A symbol shows BUY, Strength=0.51, Confidence=67% — both pass thresholds.\n"
-                "But Risk Level=HIGH. Bob enters anyway.\n"
-                "The conflicting factors cause instability — the signal reverses in 3 days at a loss.\n"
-                "✅ Correct: Risk Level=HIGH is an additional warning. All metrics must pass, including this one.",
-            ),
-            (
-                "Entering without a stop-loss",
-                "Always set a stop-loss before entering. Max acceptable loss: ≤ 5% of capital",
-                "Bob buys a stock, thinking 'it's a long-term hold, I don't need a stop'.\n"
-                "The company releases shocking negative news — stock drops 40% in one day.\n"
-                "Without a stop, he loses $8,000 (8% of total capital).\n"
-                "✅ Correct: Even long-term positions need stops. Surprises always come without warning.",
-            ),
-        ]
+        mistakes = _mistakes("en")
 
         for i, (wrong, right, example) in enumerate(mistakes, 1):
             with st.expander(f"❌ Mistake {i}: {wrong}"):
@@ -4,6 +4,7 @@ import sys
 from pathlib import Path
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
@@ -20,12 +21,36 @@ st.caption(
 
 # ── Load PaperTrader ──────────────────────────────────────────────────
 from strategy.paper_trader import PaperTrader
-from db.models import get_paper_trades, reset_paper_portfolio, get_paper_positions
+from db.models import (get_paper_trades, get_paper_trade_stats, reset_paper_portfolio,
+                       get_paper_positions)
 
 initial_cap = float(st.session_state.get("paper_capital", 100_000))
 pos_pct     = float(st.session_state.get("paper_pos_pct", 0.10))
 trader = PaperTrader(initial_capital=initial_cap, position_size_pct=pos_pct)
 
+# Portfolio reads are cached across reruns/tab switches; actions that change
+# the paper portfolio bump this version so the next render misses the cache.
+portfolio_ver = st.session_state.setdefault("paper_portfolio_ver", 0)
+
+
+def _bump_portfolio_ver():
+    st.session_state["paper_portfolio_ver"] = portfolio_ver + 1
+
+
+@st.cache_data(ttl=30)
+def _load_summary(capital: float, size_pct: float, ver: int) -> dict:
+    return PaperTrader(initial_capital=capital, position_size_pct=size_pct).get_portfolio_summary()
+
+
+@st.cache_data(ttl=30)
+def _load_trades(ver: int, limit: int) -> list[dict]:
+    return get_paper_trades(limit)
+
+
+@st.cache_data(ttl=30)
+def _load_trade_stats(ver: int) -> dict:
+    return get_paper_trade_stats()
+
 # ════════════════════════════════════════════════════════════════════════
 # Sidebar controls
 # ════════════════════════════════════════════════════════════════════════
@@ -50,6 +75,7 @@ with st.sidebar:
     if st.button("🔄 " + ("重置投資組合" if zh else "Reset Portfolio"),
                  type="secondary", use_container_width=True):
         reset_paper_portfolio()
+        _bump_portfolio_ver()
         st.success("✅ " + ("已重置" if zh else "Portfolio reset"))
         st.rerun()
 
@@ -65,7 +91,7 @@ tabs = st.tabs(tab_labels)
 
 # ── Tab 1: Portfolio Overview ─────────────────────────────────────────
 with tabs[0]:
-    summary = trader.get_portfolio_summary()
+    summary = _load_summary(initial_cap, pos_pct, portfolio_ver)
 
     col1, col2, col3, col4 = st.columns(4)
     ret_pct = summary["total_return"] * 100
@@ -115,70 +141,63 @@ with tabs[1]:
     if not positions:
         st.info("目前沒有開倉。" if zh else "No open positions.")
     else:
-        rows = []
-        for p in positions:
-            rows.append({
-                ("標的" if zh else "Symbol"):     p["symbol"],
-                ("進場價" if zh else "Entry"):    f"${p['entry_price']:.2f}",
-                ("現價" if zh else "Current"):    f"${p['current_price']:.2f}",
-                ("股數" if zh else "Qty"):         f"{p['quantity']:.2f}",
-                ("未實現損益" if zh else "Unreal. P&L"): f"${p['unrealized_pnl']:+,.2f}",
-                ("漲跌" if zh else "Change"):      f"{p['pct_change']:+.2f}%",
-                ("止損價" if zh else "Stop"):      f"${p['stop_loss']:.2f}" if p.get("stop_loss") else "—",
-                ("距止損" if zh else "Dist"):      f"{p['dist_to_stop_pct']:.1f}%" if p.get("dist_to_stop_pct") is not None else "—",
-                ("開倉時間" if zh else "Opened"):  p.get("opened_at", "")[:10],
-            })
-        df = pd.DataFrame(rows)
-
-        def _color_pnl(val):
-            if isinstance(val, str) and val.startswith("$"):
-                try:
-                    num = float(val.replace("$", "").replace(",", "").replace("+", ""))
-                    color = "#27ae60" if num > 0 else ("#e74c3c" if num < 0 else "")
-                    return f"color: {color}"
-                except ValueError:
-                    pass
-            return ""
-
-        styled = df.style.applymap(
-            _color_pnl,
-            subset=[("未實現損益" if zh else "Unreal. P&L"),
-                    ("漲跌" if zh else "Change")]
-        )
+        pos_df = pd.DataFrame(positions)
+        df = pd.DataFrame({
+            ("標的" if zh else "Symbol"):     pos_df["symbol"],
+            ("進場價" if zh else "Entry"):    pos_df["entry_price"].map("${:.2f}".format),
+            ("現價" if zh else "Current"):    pos_df["current_price"].map("${:.2f}".format),
+            ("股數" if zh else "Qty"):         pos_df["quantity"].map("{:.2f}".format),
+            ("未實現損益" if zh else "Unreal. P&L"): pos_df["unrealized_pnl"].map("${:+,.2f}".format),
+            ("漲跌" if zh else "Change"):      pos_df["pct_change"].map("{:+.2f}%".format),
+            ("止損價" if zh else "Stop"):      pos_df["stop_loss"].map(
+                lambda v: f"${v:.2f}" if pd.notna(v) and v else "—"),
+            ("距止損" if zh else "Dist"):      pos_df["dist_to_stop_pct"].map(
+                lambda v: f"{v:.1f}%" if pd.notna(v) else "—"),
+            ("開倉時間" if zh else "Opened"):  pos_df["opened_at"].fillna("").str[:10],
+        })
+
+        # Colour from the raw numbers rather than re-parsing the formatted strings
+        pnl_label = "未實現損益" if zh else "Unreal. P&L"
+        chg_label = "漲跌" if zh else "Change"
+        raw_values = {pnl_label: pos_df["unrealized_pnl"], chg_label: pos_df["pct_change"]}
+
+        def _color_pnl(col):
+            signs = np.sign(raw_values[col.name].to_numpy(dtype=float))
+            return np.where(signs > 0, "color: #27ae60",
+                            np.where(signs < 0, "color: #e74c3c", ""))
+
+        styled = df.style.apply(_color_pnl, subset=[pnl_label, chg_label])
         st.dataframe(styled, use_container_width=True, hide_index=True)
 
 # ── Tab 3: Trade History ──────────────────────────────────────────────
 with tabs[2]:
-    trades = get_paper_trades(200)
+    trades = _load_trades(portfolio_ver, 200)
     if not trades:
         st.info("尚無交易記錄。" if zh else "No trades yet.")
     else:
-        rows = []
-        for t in trades:
-            rows.append({
-                ("時間" if zh else "Time"):        t.get("executed_at", "")[:16],
-                ("標的" if zh else "Symbol"):      t["symbol"],
-                ("動作" if zh else "Action"):      t["action"],
-                ("價格" if zh else "Price"):        f"${t['price']:.2f}",
-                ("數量" if zh else "Qty"):          f"{t['quantity']:.2f}",
-                ("損益" if zh else "P&L"):          f"${t['pnl']:+,.2f}",
-                ("原因" if zh else "Reason"):       t.get("reason", ""),
-            })
-        df_t = pd.DataFrame(rows)
+        trades_df = pd.DataFrame(trades)
+        df_t = pd.DataFrame({
+            ("時間" if zh else "Time"):        trades_df["executed_at"].fillna("").str[:16],
+            ("標的" if zh else "Symbol"):      trades_df["symbol"],
+            ("動作" if zh else "Action"):      trades_df["action"],
+            ("價格" if zh else "Price"):        trades_df["price"].map("${:.2f}".format),
+            ("數量" if zh else "Qty"):          trades_df["quantity"].map("{:.2f}".format),
+            ("損益" if zh else "P&L"):          trades_df["pnl"].map("${:+,.2f}".format),
+            ("原因" if zh else "Reason"):       trades_df["reason"].fillna(""),
+        })
         st.dataframe(df_t, use_container_width=True, hide_index=True)
 
         # Summary stats
-        closed = [t for t in trades if t["action"] in ("SELL", "STOP")]
-        if closed:
-            total_pnl = sum(t["pnl"] for t in closed)
-            wins = sum(1 for t in closed if t["pnl"] > 0)
+        stats = _load_trade_stats(portfolio_ver)
+        n_closed = stats["n_closed"]
+        if n_closed:
             st.divider()
             sc1, sc2, sc3 = st.columns(3)
             sc1.metric("總已實現損益" if zh else "Total Realized P&L",
-                       f"${total_pnl:+,.2f}")
+                       f"${stats['total_pnl']:+,.2f}")
             sc2.metric("勝率" if zh else "Win Rate",
-                       f"{wins/len(closed)*100:.1f}%" if closed else "—")
-            sc3.metric("已平倉筆數" if zh else "Closed Trades", len(closed))
+                       f"{stats['wins']/n_closed*100:.1f}%")
+            sc3.metric("已平倉筆數" if zh else "Closed Trades", n_closed)
 
 # ── Tab 4: Manual Signal Execution ───────────────────────────────────
 with tabs[3]:
@@ -220,6 +239,7 @@ with tabs[3]:
                 current_price=price_input,
             )
             if action:
+                _bump_portfolio_ver()
                 st.success(
                     f"✅ 已模擬 **{action}** {chosen_sig['symbol']} @ ${price_input:.2f}"
                     if zh else
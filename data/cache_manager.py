@@ -40,18 +40,24 @@ def cache_price_data(symbol: str, df: pd.DataFrame, asset_type: str = "stock"):
 
 
 def get_cached_price_data(symbol: str, asset_type: str = "stock",
-                          days: int = 365) -> pd.DataFrame | None:
-    """Retrieve cached price data if fresh enough."""
+                          days: int = 365,
+                          allow_stale: bool = False) -> pd.DataFrame | None:
+    """Retrieve cached price data if fresh enough.
+
+    With ``allow_stale=True`` the cached history is returned whatever its
+    age, for callers that refresh only the most recent bars themselves.
+    """
     with get_db() as conn:
-        # Check freshness of the latest entry
-        row = conn.execute("""
-            SELECT fetched_at FROM price_cache
-            WHERE symbol=? AND asset_type=?
-            ORDER BY date DESC LIMIT 1
-        """, (symbol, asset_type)).fetchone()
+        if not allow_stale:
+            # Check freshness of the latest entry
+            row = conn.execute("""
+                SELECT fetched_at FROM price_cache
+                WHERE symbol=? AND asset_type=?
+                ORDER BY date DESC LIMIT 1
+            """, (symbol, asset_type)).fetchone()
 
-        if not row or _is_stale(row["fetched_at"], CACHE_TTL["price_minutes"]):
-            return None
+            if not row or _is_stale(row["fetched_at"], CACHE_TTL["price_minutes"]):
+                return None
 
         cutoff = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
         rows = conn.execute("""
@@ -70,15 +76,22 @@ def get_cached_price_data(symbol: str, asset_type: str = "stock",
 
 
 def cache_news(symbol: str, articles: list[dict]):
-    """Store news articles in cache."""
+    """Store news articles in cache.
+
+    Articles already cached for the symbol (same title) are not duplicated;
+    only their fetched_at is refreshed so the freshness check stays correct.
+    """
+    rows = [
+        (symbol, art.get("title", ""), art.get("description", ""),
+         art.get("source", ""), art.get("url", ""), art.get("published_at", ""))
+        for art in articles
+    ]
     with get_db() as conn:
-        for art in articles:
-            conn.execute("""
-                INSERT INTO news_cache (symbol, title, description, source, url, published_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (symbol, art.get("title", ""), art.get("description", ""),
-                  art.get("source", ""), art.get("url", ""),
-                  art.get("published_at", "")))
+        conn.executemany("""
+            INSERT INTO news_cache (symbol, title, description, source, url, published_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(symbol, title) DO UPDATE SET fetched_at=datetime('now')
+        """, rows)
 
 
 def get_cached_news(symbol: str, limit: int = 20) -> list[dict] | None:
@@ -1,7 +1,9 @@
 """Cryptocurrency data fetcher using ccxt with exchange fallback and retry."""
 
 import ccxt
+import numpy as np
 import pandas as pd
+import random
 import time
 import logging
 import threading
@@ -11,6 +13,7 @@ logger = logging.getLogger(__name__)
 
 _MAX_RETRIES = 3
 _BACKOFF_BASE = 2.0
+_OHLCV_LIMIT = 1000
 
 # Exchanges to try in order (Binance often blocked by region)
 _EXCHANGE_CLASSES = [
@@ -20,31 +23,44 @@ _EXCHANGE_CLASSES = [
     ("binance", lambda: ccxt.binance({"enableRateLimit": True})),
 ]
 
+_EXCHANGE_TTL = 900  # Re-probe the exchange list every 15 min so a recovered primary is picked up
+
 _active_exchange = None
 _active_name = None
+_active_ts = 0.0
 _exchange_lock = threading.Lock()
 
 
 def _get_exchange():
-    """Get a working exchange, with fallback across multiple providers."""
-    global _active_exchange, _active_name
+    """Get a working exchange, with fallback across multiple providers.
+
+    The selection is cached for ``_EXCHANGE_TTL`` seconds, after which the
+    providers are probed again in priority order.
+    """
+    global _active_exchange, _active_name, _active_ts
     with _exchange_lock:
-        if _active_exchange is not None:
+        if _active_exchange is not None and time.monotonic() - _active_ts < _EXCHANGE_TTL:
             return _active_exchange
 
         for name, factory in _EXCHANGE_CLASSES:
             try:
-                ex = factory()
+                # Reuse the live instance so its loaded markets survive the re-probe
+                ex = _active_exchange if name == _active_name else factory()
                 ex.fetch_ticker("BTC/USDT")
+                if name != _active_name:
+                    logger.info("Using crypto exchange: %s", name)
                 _active_exchange = ex
                 _active_name = name
-                logger.info("Using crypto exchange: %s", name)
+                _active_ts = time.monotonic()
                 return ex
             except Exception as e:
                 logger.info("Exchange %s unavailable: %s", name, e)
                 continue
 
-        # All failed — do NOT cache so the next call retries the exchange list
+        # All failed — do NOT refresh the timestamp so the next call retries the list
+        if _active_exchange is not None:
+            logger.warning("No crypto exchange responded; keeping %s", _active_name)
+            return _active_exchange
         logger.warning("No crypto exchange available")
         return _EXCHANGE_CLASSES[0][1]()
 
@@ -58,11 +74,30 @@ def _retry(func, retries=_MAX_RETRIES):
             if attempt == retries - 1:
                 logger.warning("Failed after %d retries: %s", retries, e)
                 raise
-            wait = _BACKOFF_BASE ** attempt
+            # Full jitter: concurrent workers retrying after a 429 spread out
+            # instead of hitting the API again in lockstep
+            wait = random.uniform(0, 2 * _BACKOFF_BASE ** attempt)
             logger.info("Retry %d/%d after %.1fs: %s", attempt + 1, retries, wait, e)
             time.sleep(wait)
 
 
+def _fetch_ohlcv_window(exchange, symbol: str, timeframe: str,
+                       since: int, until: int, tf_ms: int) -> list[list]:
+    """Fetch all candles in [since, until), paginating if the exchange caps the page size."""
+    candles_out = []
+    while since < until:
+        candles = _retry(lambda: exchange.fetch_ohlcv(symbol, timeframe=timeframe,
+                                                      since=since, limit=_OHLCV_LIMIT))
+        if not candles:
+            break
+        candles_out.extend(c for c in candles if c[0] < until)
+        last = candles[-1][0]
+        if last >= until - tf_ms:
+            break
+        since = last + 1
+    return candles_out
+
+
 def fetch_crypto_data(symbol: str = "BTC/USDT", timeframe: str = "1d",
                       days: int = 365) -> pd.DataFrame:
     """Fetch historical OHLCV data for a crypto pair.
@@ -77,26 +112,26 @@ def fetch_crypto_data(symbol: str = "BTC/USDT", timeframe: str = "1d",
     """
     exchange = _get_exchange()
     since = exchange.parse8601((datetime.utcnow() - timedelta(days=days)).isoformat())
+    until = exchange.milliseconds()
 
+    # Candles are fetched one page after another: the ccxt instance is
+    # shared and its rate-limit throttle is not thread-safe, so parallel
+    # pages would overrun the exchange's limit.
+    tf_ms = exchange.parse_timeframe(timeframe) * 1000
     all_candles = []
     try:
-        while True:
-            candles = _retry(lambda: exchange.fetch_ohlcv(symbol, timeframe=timeframe, since=since, limit=1000))
-            if not candles:
-                break
-            all_candles.extend(candles)
-            since = candles[-1][0] + 1
-            if len(candles) < 1000:
-                break
+        all_candles = _fetch_ohlcv_window(exchange, symbol, timeframe, since, until, tf_ms)
     except Exception as e:
         logger.warning("Failed to fetch crypto data for %s: %s", symbol, e)
 
     if not all_candles:
         return pd.DataFrame()
 
-    df = pd.DataFrame(all_candles, columns=["timestamp", "open", "high", "low", "close", "volume"])
-    df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms")
-    df = df.set_index("timestamp")
+    # One typed copy into a contiguous float64 buffer instead of per-cell dtype inference
+    arr = np.asarray(all_candles, dtype=np.float64)
+    index = pd.to_datetime(arr[:, 0].astype(np.int64), unit="ms")
+    index.name = "timestamp"
+    df = pd.DataFrame(arr[:, 1:], columns=["open", "high", "low", "close", "volume"], index=index)
     df = df[~df.index.duplicated(keep="last")]
     return df
 
@@ -117,8 +152,21 @@ def fetch_multiple_crypto(pairs: list[str], timeframe: str = "1d",
     return results
 
 
-def get_crypto_price(symbol: str = "BTC/USDT") -> dict | None:
-    """Get current crypto price and 24h change."""
+_LIVE_PRICE_MAX_AGE = 5.0  # seconds a streamed ticker may be served instead of REST
+
+
+def get_crypto_price(symbol: str = "BTC/USDT", use_live: bool = True) -> dict | None:
+    """Get current crypto price and 24h change.
+
+    When the background price feed (data.ws_price_feed) has a ticker for the
+    symbol younger than ``_LIVE_PRICE_MAX_AGE`` it is returned from memory;
+    otherwise the exchange REST API is queried.
+    """
+    if use_live:
+        from data.ws_price_feed import get_fresh_live_price
+        live = get_fresh_live_price(symbol, _LIVE_PRICE_MAX_AGE)
+        if live:
+            return {k: v for k, v in live.items() if k != "updated_at"}
     try:
         exchange = _get_exchange()
         ticker = _retry(lambda: exchange.fetch_ticker(symbol))
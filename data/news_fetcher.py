@@ -1,6 +1,9 @@
 """News data fetcher using MarketAux and Finnhub free APIs with retry."""
 
+import json
+import re
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import logging
 from concurrent.futures import ThreadPoolExecutor
@@ -11,19 +14,44 @@ from data.cache_manager import get_cached_news, cache_news
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 _MAX_RETRIES = 2
 _BACKOFF_BASE = 1.5
+_BATCH_WORKERS = 8
+_MARKETAUX_MIN_BATCH = 3  # symbols per MarketAux request, trimming each one's articles to fit
+_DEDUP_JACCARD = 0.8  # Token-set similarity above which two headlines are the same story
+_TOKEN_RE = re.compile(r"\w+")
 
 # Rate limiters for each API
 _marketaux_limiter = RateLimiter(RATE_LIMITS["marketaux_per_day"], 86400)  # per day
 _finnhub_limiter = RateLimiter(RATE_LIMITS["finnhub_per_minute"], 60)     # per minute
 
+# Shared client so repeated MarketAux/Finnhub calls reuse keep-alive connections.
+# Prefer an HTTP/2 httpx client (multiplexed streams, HPACK headers) when
+# httpx and h2 are installed; otherwise use a pooled requests.Session.
+# Both expose the same get()/raise_for_status()/content surface used below.
+try:
+    import httpx
+    import h2  # noqa: F401 — required by httpx for http2=True
+    _client = httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+    )
+except ImportError:
+    _client = requests.Session()
+    _client.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=0))
+
 
-def _request_with_retry(url: str, params: dict, timeout: int = 10) -> requests.Response:
+def _request_with_retry(url: str, params: dict, timeout: int = 10):
     """HTTP GET with exponential backoff retry."""
     for attempt in range(_MAX_RETRIES):
         try:
-            resp = requests.get(url, params=params, timeout=timeout)
+            resp = _client.get(url, params=params, timeout=timeout)
             resp.raise_for_status()
             return resp
         except Exception as e:
@@ -50,30 +78,89 @@ def fetch_marketaux_news(symbol: str, limit: int = 10) -> list[dict]:
                 "api_token": MARKETAUX_API_KEY,
             },
         )
-        data = resp.json()
-        articles = []
-        for item in data.get("data", []):
-            articles.append({
-                "title": item.get("title", ""),
-                "description": item.get("description", ""),
-                "source": item.get("source", ""),
-                "url": item.get("url", ""),
-                "published_at": item.get("published_at", ""),
-            })
-        return articles
+        data = _json_loads(resp.content)
+        return [_marketaux_article(item) for item in data.get("data", [])]
     except Exception as e:
         logger.warning("MarketAux fetch failed for %s: %s", symbol, e)
         return []
 
 
+def _marketaux_article(item: dict) -> dict:
+    return {
+        "title": item.get("title", ""),
+        "description": item.get("description", ""),
+        "source": item.get("source", ""),
+        "url": item.get("url", ""),
+        "published_at": item.get("published_at", ""),
+    }
+
+
+def fetch_marketaux_news_batch(symbols: list[str], limit: int = 10) -> dict[str, list[dict]]:
+    """Fetch MarketAux news for many symbols in as few requests as the plan allows.
+
+    Each request covers at least ``_MARKETAUX_MIN_BATCH`` symbols (as far
+    as the plan's per-request article cap allows), so when the cap is small
+    each symbol's share of a batch drops below ``limit`` to fit.  Articles are routed to every
+    requested symbol listed in their entities.  Symbols a batch left
+    without articles (crowded out by heavily covered tickers, or a failed
+    request) are then fetched on their own.  Requests run concurrently.
+    """
+    if not MARKETAUX_API_KEY or not symbols:
+        return {}
+    cap = RATE_LIMITS["marketaux_articles_per_request"]
+    per_symbol = max(1, min(limit, cap // _MARKETAUX_MIN_BATCH))
+    batch_size = max(1, cap // per_symbol)
+    batches = [symbols[i:i + batch_size] for i in range(0, len(symbols), batch_size)]
+
+    by_symbol: dict[str, list[dict]] = {}
+    with ThreadPoolExecutor(max_workers=_BATCH_WORKERS) as executor:
+        for batch, fut in [(b, executor.submit(_fetch_marketaux_batch, b, per_symbol))
+                           for b in batches]:
+            try:
+                by_symbol.update(fut.result())
+            except Exception as e:
+                logger.warning("MarketAux batch fetch failed for %d symbols: %s", len(batch), e)
+
+        missing = [sym for sym in symbols if not by_symbol.get(sym)]
+        for sym, articles in zip(missing, executor.map(
+                lambda sym: fetch_marketaux_news(sym, limit), missing)):
+            by_symbol[sym] = articles
+    return {sym: articles for sym, articles in by_symbol.items() if articles}
+
+
+def _fetch_marketaux_batch(symbols: list[str], limit: int) -> dict[str, list[dict]]:
+    """One MarketAux request for ``symbols``: {symbol: articles}."""
+    _marketaux_limiter.acquire()
+    resp = _request_with_retry(
+        "https://api.marketaux.com/v1/news/all",
+        params={
+            "symbols": ",".join(symbols),
+            "filter_entities": "true",
+            "language": "en",
+            "limit": min(limit * len(symbols), RATE_LIMITS["marketaux_articles_per_request"]),
+            "api_token": MARKETAUX_API_KEY,
+        },
+    )
+    wanted = set(symbols)
+    by_symbol: dict[str, list[dict]] = {}
+    for item in _json_loads(resp.content).get("data", []):
+        article = _marketaux_article(item)
+        for entity in item.get("entities") or ():
+            sym = entity.get("symbol")
+            if sym in wanted and len(by_symbol.setdefault(sym, [])) < limit:
+                by_symbol[sym].append(article)
+    return by_symbol
+
+
 def fetch_finnhub_news(symbol: str, days: int = 7) -> list[dict]:
     """Fetch news from Finnhub API (free tier: 60 calls/min)."""
     if not FINNHUB_API_KEY:
         return []
     _finnhub_limiter.acquire()
     try:
-        today = datetime.now().strftime("%Y-%m-%d")
-        start = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+        now = datetime.now()
+        today = now.strftime("%Y-%m-%d")
+        start = (now - timedelta(days=days)).strftime("%Y-%m-%d")
         resp = _request_with_retry(
             "https://finnhub.io/api/v1/company-news",
             params={
@@ -84,7 +171,7 @@ def fetch_finnhub_news(symbol: str, days: int = 7) -> list[dict]:
             },
         )
         articles = []
-        for item in resp.json()[:20]:
+        for item in _json_loads(resp.content)[:20]:
             articles.append({
                 "title": item.get("headline", ""),
                 "description": item.get("summary", ""),
@@ -98,8 +185,52 @@ def fetch_finnhub_news(symbol: str, days: int = 7) -> list[dict]:
         return []
 
 
+def _dedupe_articles(articles: list[dict]) -> list[dict]:
+    """Drop near-duplicate headlines using token-set Jaccard similarity.
+
+    Headlines for the same story often differ only in punctuation or a
+    source prefix, so exact title matching lets them through. N is small
+    (≤ 30 per symbol), so a pairwise comparison is cheap.
+    """
+    seen: list[frozenset] = []
+    unique = []
+    for art in articles:
+        tokens = frozenset(_TOKEN_RE.findall(art["title"].lower()))
+        if not tokens:
+            continue
+        if any(len(tokens & prev) / len(tokens | prev) >= _DEDUP_JACCARD for prev in seen):
+            continue
+        seen.append(tokens)
+        unique.append(art)
+    return unique
+
+
+def _merge_news(symbol: str, articles: list[dict]) -> list[dict]:
+    """Dedupe fetched articles, falling back to / refreshing the news cache."""
+    unique = _dedupe_articles(articles)
+
+    # Fallback to cache if live fetch returned nothing
+    if not unique:
+        try:
+            cached = get_cached_news(symbol)
+            if cached:
+                logger.info("Using cached news for %s (live fetch returned empty)", symbol)
+                return cached
+        except Exception as e:
+            logger.debug("Failed to read news cache for %s: %s", symbol, e)
+
+    # Cache successful results for future fallback
+    if unique:
+        try:
+            cache_news(symbol, unique)
+        except Exception as e:
+            logger.debug("Failed to write news cache for %s: %s", symbol, e)
+
+    return unique
+
+
 def fetch_news(symbol: str) -> list[dict]:
-    """Fetch news from all available sources, deduplicate by title.
+    """Fetch news from all available sources, deduplicate near-identical titles.
 
     Uses ThreadPoolExecutor to fetch MarketAux and Finnhub in parallel.
     Falls back to cached news if live fetch returns nothing.
@@ -123,34 +254,36 @@ def fetch_news(symbol: str) -> list[dict]:
             logger.warning("Finnhub concurrent fetch failed: %s", e)
             finnhub_articles = []
 
-    articles = []
-    articles.extend(marketaux_articles)
-    articles.extend(finnhub_articles)
+    return _merge_news(symbol, marketaux_articles + finnhub_articles)
 
-    # Deduplicate by title
-    seen = set()
-    unique = []
-    for art in articles:
-        key = art["title"].lower().strip()
-        if key and key not in seen:
-            seen.add(key)
-            unique.append(art)
 
-    # Fallback to cache if live fetch returned nothing
-    if not unique:
-        try:
-            cached = get_cached_news(symbol)
-            if cached:
-                logger.info("Using cached news for %s (live fetch returned empty)", symbol)
-                return cached
-        except Exception as e:
-            logger.debug("Failed to read news cache for %s: %s", symbol, e)
+def fetch_news_batch(symbols: list[str]) -> dict[str, list[dict]]:
+    """Fetch news for a whole watchlist: {symbol: articles}.
 
-    # Cache successful results for future fallback
-    if unique:
+    MarketAux is queried in multi-symbol batches; Finnhub has no
+    multi-symbol endpoint, so its per-symbol calls run concurrently
+    alongside it.
+    """
+    if not symbols:
+        return {}
+    with ThreadPoolExecutor(max_workers=_BATCH_WORKERS) as executor:
+        marketaux_future = executor.submit(fetch_marketaux_news_batch, symbols)
+        finnhub_futures = {
+            sym: executor.submit(fetch_finnhub_news, sym.split("/")[0]) for sym in symbols
+        }
         try:
-            cache_news(symbol, unique)
+            marketaux = marketaux_future.result()
         except Exception as e:
-            logger.debug("Failed to write news cache for %s: %s", symbol, e)
+            logger.warning("MarketAux batch fetch failed: %s", e)
+            marketaux = {}
+
+        news = {}
+        for sym, fut in finnhub_futures.items():
+            try:
+                finnhub_articles = fut.result()
+            except Exception as e:
+                logger.warning("Finnhub fetch failed for %s: %s", sym, e)
+                finnhub_articles = []
+            news[sym] = _merge_news(sym, marketaux.get(sym, []) + finnhub_articles)
+    return news
 
-    return unique
@@ -1,20 +1,84 @@
 """Notification system: Telegram and Email alerts for trading signals."""
 
 import logging
+import queue
+import threading
+import time
 import requests
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from config import PAGE_TITLE
 
 logger = logging.getLogger(__name__)
 
+# Shared session so consecutive sends reuse the keep-alive connection to
+# api.telegram.org instead of paying a TCP+TLS handshake per message.
+_session = requests.Session()
+_session.headers["Connection"] = "keep-alive"
+_session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=10,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.3,
+        # 429 is handled by the send worker, which honours Telegram's retry_after
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False,
+    ),
+))
+
+# Message scaffolds are built once at import; only the dynamic fields are
+# interpolated per notification.
+_TITLE = PAGE_TITLE.replace("%", "%%")
+_SIGNAL_TMPL = (
+    "%s <b>" + _TITLE + "</b>\n"
+    "\n"
+    "<b>%s — %s</b>\n"
+    "Strength: <code>%+.3f</code>\n"
+    "Confidence: <code>%.0f%%</code>\n"
+    "Risk Level: <code>%s</code>\n"
+    "\n"
+    "<b>Factor Scores:</b>\n"
+    "  Technical: <code>%+.3f</code>\n"
+    "  Sentiment: <code>%+.3f</code>\n"
+    "  ML Model:  <code>%+.3f</code>\n"
+    "\n"
+    "<i>%s</i>"
+)
+_RISK_ALERT_TMPL = (
+    "%s <b>Risk Alert%s</b>\n"
+    "Type: <code>%s</code>\n"
+    "Severity: <code>%s</code>\n"
+    "Message: %s\n"
+    "\n"
+    "<i>%s</i>"
+)
+_SUMMARY_HEADER = "\U0001f4ca <b>" + PAGE_TITLE + " - Daily Summary</b>"
+_SUMMARY_EMPTY = _SUMMARY_HEADER + "\n\nNo signals generated today."
+_DIR_ICONS = {"BUY": "\u2705", "SELL": "\u274c", "HOLD": "\u23f8\ufe0f"}
+_SEV_ICONS = {"critical": "\U0001f534", "high": "\U0001f7e0",
+              "warning": "\U0001f7e1", "info": "\U0001f535"}
+
+# Outgoing notifications are queued and sent by one background worker so
+# callers (e.g. the scheduler's scan loop) never block on Telegram latency
+# or rate limiting.
+_MAX_SEND_ATTEMPTS = 3
+_tg_queue: queue.Queue = queue.Queue()
+_tg_worker: threading.Thread | None = None
+_tg_worker_lock = threading.Lock()
+
 # Module-level cache for Telegram credentials.
-# Avoids hitting the DB on every notification call during a scan.
-_tg_cache: dict = {"bot_token": None, "chat_id": None}
+# Avoids hitting the DB on every notification call during a scan; the TTL
+# lets credentials saved from another process/page be picked up.
+_CREDS_TTL = 60  # seconds
+_tg_cache: dict = {"bot_token": None, "chat_id": None, "expires_at": 0.0}
 
 
 def _get_telegram_creds() -> tuple[str, str]:
-    """Return (bot_token, chat_id), reading from DB only when not yet cached."""
-    if _tg_cache["bot_token"] is None:
+    """Return (bot_token, chat_id), reading from DB at most once per TTL."""
+    now = time.monotonic()
+    if _tg_cache["bot_token"] is None or now >= _tg_cache["expires_at"]:
         try:
             from db.models import get_setting
             _tg_cache["bot_token"] = get_setting("telegram_bot_token", "")
@@ -23,6 +87,7 @@ def _get_telegram_creds() -> tuple[str, str]:
             logger.warning("Failed to load Telegram settings: %s", e)
             _tg_cache["bot_token"] = ""
             _tg_cache["chat_id"]   = ""
+        _tg_cache["expires_at"] = now + _CREDS_TTL
     return _tg_cache["bot_token"], _tg_cache["chat_id"]
 
 
@@ -30,6 +95,7 @@ def invalidate_telegram_cache():
     """Call this after saving new Telegram credentials so they are re-read."""
     _tg_cache["bot_token"] = None
     _tg_cache["chat_id"]   = None
+    _tg_cache["expires_at"] = 0.0
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -53,7 +119,7 @@ def send_telegram(bot_token: str, chat_id: str, message: str) -> bool:
 
     try:
         url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-        resp = requests.post(url, json={
+        resp = _session.post(url, json={
             "chat_id": chat_id,
             "text": message,
             "parse_mode": "HTML",
@@ -65,78 +131,109 @@ def send_telegram(bot_token: str, chat_id: str, message: str) -> bool:
         return False
 
 
+def _telegram_worker():
+    """Drain the notification queue in order, backing off on HTTP 429."""
+    while True:
+        bot_token, chat_id, message = _tg_queue.get()
+        try:
+            url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+            payload = {"chat_id": chat_id, "text": message, "parse_mode": "HTML"}
+            for attempt in range(_MAX_SEND_ATTEMPTS):
+                resp = _session.post(url, json=payload, timeout=10)
+                if resp.status_code != 429 or attempt == _MAX_SEND_ATTEMPTS - 1:
+                    break
+                try:
+                    retry_after = float(resp.json()["parameters"]["retry_after"])
+                except (ValueError, KeyError, TypeError):
+                    retry_after = 1.0
+                logger.info("Telegram rate limited, retrying in %.0fs", retry_after)
+                time.sleep(retry_after)
+            resp.raise_for_status()
+        except Exception as e:
+            logger.error("Telegram send failed: %s", e)
+        finally:
+            _tg_queue.task_done()
+
+
+def _enqueue_telegram(bot_token: str, chat_id: str, message: str) -> None:
+    """Queue a message for the background sender, starting it on first use."""
+    global _tg_worker
+    with _tg_worker_lock:
+        if _tg_worker is None or not _tg_worker.is_alive():
+            _tg_worker = threading.Thread(
+                target=_telegram_worker, daemon=True, name="telegram_sender",
+            )
+            _tg_worker.start()
+    _tg_queue.put((bot_token, chat_id, message))
+
+
 def format_signal_message(symbol: str, signal: dict) -> str:
     """Format a trading signal into a readable Telegram message."""
     direction = signal.get("direction", "HOLD")
-    icon = {"BUY": "\u2705", "SELL": "\u274c", "HOLD": "\u23f8\ufe0f"}.get(direction, "\u2753")
-
-    strength = signal.get("strength", 0)
-    confidence = signal.get("confidence", 0)
-    tech = signal.get("technical_score", 0)
-    sent = signal.get("sentiment_score", 0)
-    ml = signal.get("ml_score", 0)
-    risk = signal.get("risk_level", "N/A")
-
-    msg = (
-        f"{icon} <b>{PAGE_TITLE}</b>\n"
-        f"\n"
-        f"<b>{symbol} — {direction}</b>\n"
-        f"Strength: <code>{strength:+.3f}</code>\n"
-        f"Confidence: <code>{confidence:.0%}</code>\n"
-        f"Risk Level: <code>{risk}</code>\n"
-        f"\n"
-        f"<b>Factor Scores:</b>\n"
-        f"  Technical: <code>{tech:+.3f}</code>\n"
-        f"  Sentiment: <code>{sent:+.3f}</code>\n"
-        f"  ML Model:  <code>{ml:+.3f}</code>\n"
-        f"\n"
-        f"<i>{datetime.now().strftime('%Y-%m-%d %H:%M')}</i>"
+    icon = _DIR_ICONS.get(direction, "\u2753")
+
+    return _SIGNAL_TMPL % (
+        icon, symbol, direction,
+        signal.get("strength", 0),
+        signal.get("confidence", 0) * 100,
+        signal.get("risk_level", "N/A"),
+        signal.get("technical_score", 0),
+        signal.get("sentiment_score", 0),
+        signal.get("ml_score", 0),
+        time.strftime("%Y-%m-%d %H:%M"),
     )
-    return msg
 
 
 def format_risk_alert_message(alert_type: str, severity: str, message: str,
                                symbol: str = None) -> str:
     """Format a risk alert into a Telegram message."""
-    sev_icon = {"critical": "\U0001f534", "high": "\U0001f7e0",
-                "warning": "\U0001f7e1", "info": "\U0001f535"}.get(severity, "\u26aa")
+    sev_icon = _SEV_ICONS.get(severity, "\u26aa")
     sym_str = f" ({symbol})" if symbol else ""
-    return (
-        f"{sev_icon} <b>Risk Alert{sym_str}</b>\n"
-        f"Type: <code>{alert_type}</code>\n"
-        f"Severity: <code>{severity.upper()}</code>\n"
-        f"Message: {message}\n"
-        f"\n"
-        f"<i>{datetime.now().strftime('%Y-%m-%d %H:%M')}</i>"
+    return _RISK_ALERT_TMPL % (
+        sev_icon, sym_str, alert_type, severity.upper(), message,
+        time.strftime("%Y-%m-%d %H:%M"),
     )
 
 
 def format_daily_summary(signals: list[dict]) -> str:
     """Format a daily signal summary message."""
     if not signals:
-        return f"\U0001f4ca <b>{PAGE_TITLE} - Daily Summary</b>\n\nNo signals generated today."
-
-    buys = [s for s in signals if s.get("direction") == "BUY"]
-    sells = [s for s in signals if s.get("direction") == "SELL"]
-    holds = [s for s in signals if s.get("direction") == "HOLD"]
+        return _SUMMARY_EMPTY
+
+    # One pass: only the first five BUY/SELL entries are rendered, so keep
+    # those and count the rest
+    buys, sells = [], []
+    n_buy = n_sell = n_hold = 0
+    for s in signals:
+        d = s.get("direction")
+        if d == "BUY":
+            n_buy += 1
+            if n_buy <= 5:
+                buys.append(s)
+        elif d == "SELL":
+            n_sell += 1
+            if n_sell <= 5:
+                sells.append(s)
+        elif d == "HOLD":
+            n_hold += 1
 
     lines = [
-        f"\U0001f4ca <b>{PAGE_TITLE} - Daily Summary</b>",
-        f"\U0001f4c5 {datetime.now().strftime('%Y-%m-%d')}",
+        _SUMMARY_HEADER,
+        f"\U0001f4c5 {time.strftime('%Y-%m-%d')}",
         f"",
         f"Total signals: {len(signals)}",
-        f"\u2705 BUY: {len(buys)}  |  \u274c SELL: {len(sells)}  |  \u23f8\ufe0f HOLD: {len(holds)}",
+        f"\u2705 BUY: {n_buy}  |  \u274c SELL: {n_sell}  |  \u23f8\ufe0f HOLD: {n_hold}",
         f"",
     ]
 
     if buys:
         lines.append("<b>BUY Signals:</b>")
-        for s in buys[:5]:
+        for s in buys:
             lines.append(f"  \u2022 {s['symbol']} (confidence: {s.get('confidence', 0):.0%})")
 
     if sells:
         lines.append("<b>SELL Signals:</b>")
-        for s in sells[:5]:
+        for s in sells:
             lines.append(f"  \u2022 {s['symbol']} (confidence: {s.get('confidence', 0):.0%})")
 
     return "\n".join(lines)
@@ -155,7 +252,7 @@ def notify_signal(symbol: str, signal: dict, bot_token: str = "", chat_id: str =
 
     if bot_token and chat_id:
         msg = format_signal_message(symbol, signal)
-        send_telegram(bot_token, chat_id, msg)
+        _enqueue_telegram(bot_token, chat_id, msg)
 
 
 def notify_risk_alert(alert_type: str, severity: str, message: str,
@@ -164,7 +261,7 @@ def notify_risk_alert(alert_type: str, severity: str, message: str,
     bot_token, chat_id = _get_telegram_creds()
     if bot_token and chat_id:
         msg = format_risk_alert_message(alert_type, severity, message, symbol)
-        send_telegram(bot_token, chat_id, msg)
+        _enqueue_telegram(bot_token, chat_id, msg)
 
 
 def notify_daily_summary(signals: list[dict]):
@@ -172,4 +269,4 @@ def notify_daily_summary(signals: list[dict]):
     bot_token, chat_id = _get_telegram_creds()
     if bot_token and chat_id:
         msg = format_daily_summary(signals)
-        send_telegram(bot_token, chat_id, msg)
+        _enqueue_telegram(bot_token, chat_id, msg)
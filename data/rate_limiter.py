@@ -18,30 +18,34 @@ class RateLimiter:
     def __init__(self, max_calls: int, period_seconds: float):
         self._max_calls = max_calls
         self._period = period_seconds
+        self._rate = float(max_calls) / float(period_seconds)  # tokens per second
         self._tokens = float(max_calls)
         self._last_refill = time.monotonic()
-        self._lock = threading.Lock()
+        self._cv = threading.Condition()
 
     def _refill(self) -> None:
         """Refill tokens based on elapsed time."""
         now = time.monotonic()
-        elapsed = now - self._last_refill
-        new_tokens = elapsed * (self._max_calls / self._period)
-        self._tokens = min(self._max_calls, self._tokens + new_tokens)
+        self._tokens = min(self._max_calls, self._tokens + (now - self._last_refill) * self._rate)
         self._last_refill = now
 
     def acquire(self) -> None:
-        """Block until a token is available, then consume it."""
-        while True:
-            with self._lock:
+        """Block until a token is available, then consume it.
+
+        Waiters sleep on a condition variable instead of polling; each
+        successful consumer wakes one waiter to re-check the bucket.
+        """
+        with self._cv:
+            while True:
                 self._refill()
                 if self._tokens >= 1.0:
                     self._tokens -= 1.0
+                    self._cv.notify()
                     return
                 # Calculate wait time for next token
-                wait = (1.0 - self._tokens) / (self._max_calls / self._period)
-            logger.debug("Rate limiter waiting %.2fs for next token", wait)
-            time.sleep(wait)
+                wait = (1.0 - self._tokens) / self._rate
+                logger.debug("Rate limiter waiting %.2fs for next token", wait)
+                self._cv.wait(timeout=wait)
 
     def try_acquire(self) -> bool:
         """Try to consume a token without blocking.
@@ -49,7 +53,7 @@ class RateLimiter:
         Returns:
             True if a token was consumed, False otherwise.
         """
-        with self._lock:
+        with self._cv:
             self._refill()
             if self._tokens >= 1.0:
                 self._tokens -= 1.0
@@ -3,7 +3,6 @@
 import logging
 import threading
 import praw
-from concurrent.futures import ThreadPoolExecutor
 from config import REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET, REDDIT_USER_AGENT, RATE_LIMITS
 from data.rate_limiter import RateLimiter
 
@@ -47,6 +46,9 @@ def fetch_reddit_posts(symbol: str, asset_type: str = "stock",
                        limit: int = 20) -> list[dict]:
     """Fetch recent Reddit posts mentioning a symbol.
 
+    All subreddits are searched with one multireddit query
+    (``r/a+b+c``), so the whole search costs one listing request.
+
     Args:
         symbol: Asset symbol (e.g., 'AAPL' or 'BTC')
         asset_type: 'stock' or 'crypto'
@@ -61,25 +63,26 @@ def fetch_reddit_posts(symbol: str, asset_type: str = "stock",
 
     ticker = symbol.split("/")[0]
     subreddits = SUBREDDIT_MAP.get(asset_type, SUBREDDIT_MAP["stock"])
-    posts = []
 
-    for sub_name in subreddits:
-        _reddit_limiter.acquire()
-        try:
-            subreddit = reddit.subreddit(sub_name)
-            for post in subreddit.search(ticker, sort="new", time_filter="week", limit=limit):
-                posts.append({
-                    "title": post.title,
-                    "text": post.selftext[:500] if post.selftext else "",
-                    "score": post.score,
-                    "num_comments": post.num_comments,
-                    "subreddit": sub_name,
-                    "created": post.created_utc,
-                    "url": f"https://reddit.com{post.permalink}",
-                })
-        except Exception as e:
-            logger.warning("Reddit posts fetch failed for %s in r/%s: %s", ticker, sub_name, e)
-            continue
+    _reddit_limiter.acquire()
+    try:
+        multi = reddit.subreddit("+".join(subreddits))
+        posts = [
+            {
+                "title": post.title,
+                "text": post.selftext[:500] if post.selftext else "",
+                "score": post.score,
+                "num_comments": post.num_comments,
+                "subreddit": post.subreddit.display_name,
+                "created": post.created_utc,
+                "url": f"https://reddit.com{post.permalink}",
+            }
+            for post in multi.search(ticker, sort="new", time_filter="week",
+                                     limit=limit * len(subreddits))
+        ]
+    except Exception as e:
+        logger.warning("Reddit posts fetch failed for %s: %s", ticker, e)
+        return []
 
     # Sort by score (engagement)
     posts.sort(key=lambda x: x["score"], reverse=True)
@@ -111,12 +114,15 @@ def fetch_reddit_comments(symbol: str, asset_type: str = "stock",
                     break
                 post.comments.replace_more(limit=0)
                 for comment in post.comments[:10]:
-                    if hasattr(comment, "body") and len(comment.body) > 20:
-                        comments.append(comment.body[:300])
-                    if len(comments) >= limit:
-                        break
+                    body = getattr(comment, "body", None)
+                    if body and len(body) > 20:
+                        comments.append(body[:300])
+                        # Only an append can reach the limit, so check here
+                        if len(comments) >= limit:
+                            break
         except Exception as e:
             logger.warning("Reddit comments fetch failed for %s in r/%s: %s", ticker, sub_name, e)
             continue
 
-    return comments[:limit]
+    # Every loop level stops at the limit, so no final truncation is needed
+    return comments
@@ -2,8 +2,10 @@
 
 import yfinance as yf
 import pandas as pd
+import random
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from config import RATE_LIMITS
 from data.rate_limiter import RateLimiter
@@ -12,9 +14,16 @@ logger = logging.getLogger(__name__)
 
 _MAX_RETRIES = 3
 _BACKOFF_BASE = 1.5  # seconds
+_FETCH_WORKERS = 8
 
 _yfinance_limiter = RateLimiter(RATE_LIMITS["yfinance_per_minute"], 60)
 
+# No explicit session is passed to yf.Ticker: yfinance routes every Ticker
+# through a process-wide YfData singleton that owns one pooled session, so
+# keep-alive connections are already shared across symbols. Injecting a plain
+# requests.Session would replace that session (and, on current yfinance, its
+# curl_cffi browser impersonation) for the whole process.
+
 
 def _retry(func, *args, retries=_MAX_RETRIES, **kwargs):
     """Call func with exponential backoff retries."""
@@ -25,7 +34,9 @@ def _retry(func, *args, retries=_MAX_RETRIES, **kwargs):
             if attempt == retries - 1:
                 logger.warning("Failed after %d retries: %s", retries, e)
                 raise
-            wait = _BACKOFF_BASE ** attempt
+            # Full jitter: concurrent workers retrying after a 429 spread out
+            # instead of hitting the API again in lockstep
+            wait = random.uniform(0, 2 * _BACKOFF_BASE ** attempt)
             logger.info("Retry %d/%d after %.1fs: %s", attempt + 1, retries, wait, e)
             time.sleep(wait)
 
@@ -42,7 +53,7 @@ def fetch_stock_data(symbol: str, period: str = "1y", interval: str = "1d") -> p
         DataFrame with OHLCV data.
     """
     try:
-        ticker = _retry(lambda: yf.Ticker(symbol))
+        ticker = yf.Ticker(symbol)  # constructor does no network I/O
         df = _retry(lambda: ticker.history(period=period, interval=interval))
     except Exception as e:
         logger.warning("Failed to fetch stock data for %s: %s", symbol, e)
@@ -92,18 +103,20 @@ def fetch_stock_info(symbol: str) -> dict:
 
 
 def fetch_multiple_stocks(symbols: list[str], period: str = "1y") -> dict[str, pd.DataFrame]:
-    """Fetch data for multiple symbols."""
-    results = {}
-    for sym in symbols:
+    """Fetch data for multiple symbols concurrently (rate-limited)."""
+    def _fetch(sym: str) -> pd.DataFrame:
         _yfinance_limiter.acquire()
         try:
-            df = fetch_stock_data(sym, period=period)
-            if not df.empty:
-                results[sym] = df
+            return fetch_stock_data(sym, period=period)
         except Exception as e:
             logger.warning("Failed to fetch stock %s: %s", sym, e)
-            continue
-    return results
+            return pd.DataFrame()
+
+    if not symbols:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(_FETCH_WORKERS, len(symbols))) as executor:
+        frames = list(executor.map(_fetch, symbols))
+    return {sym: df for sym, df in zip(symbols, frames) if not df.empty}
 
 
 def get_current_price(symbol: str) -> dict | None:
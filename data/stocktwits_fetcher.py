@@ -20,18 +20,58 @@ fetch_stocktwits_posts(symbol, limit=30) -> list[str]
     Returns a list of message body strings (may be empty on error).
 """
 
+import json
 import logging
+import threading
 import time
+from collections import OrderedDict
+
+import requests
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 _CACHE_TTL = 15 * 60  # 15-minute per-symbol cache
-_cache: dict[str, dict] = {}
+_CACHE_MAX = 512      # LRU bound on cached symbols
+_cache: OrderedDict[str, dict] = OrderedDict()
+_cache_lock = threading.Lock()
+_symbol_locks: dict[str, threading.Lock] = {}
+
+# Keep-alive session shared across symbols
+_session = requests.Session()
+
+
+def _store(clean: str, entry: dict) -> None:
+    """Insert/refresh a cache entry, evicting the least recently used."""
+    with _cache_lock:
+        _cache[clean] = entry
+        _cache.move_to_end(clean)
+        while len(_cache) > _CACHE_MAX:
+            evicted, _ = _cache.popitem(last=False)
+            _symbol_locks.pop(evicted, None)
+
+
+def _fresh_messages(clean: str, now: float) -> list[str] | None:
+    with _cache_lock:
+        entry = _cache.get(clean)
+        if entry is None or now >= entry["expires_at"]:
+            return None
+        _cache.move_to_end(clean)
+        return entry["messages"]
 
 
 def fetch_stocktwits_posts(symbol: str, limit: int = 30) -> list[str]:
     """Fetch recent StockTwits messages for a symbol.
 
+    Concurrent callers that miss the cache for the same symbol are
+    coalesced: one performs the request while the others wait for and
+    reuse its result.
+
     Args:
         symbol: Ticker (e.g. "AAPL", "BTC", "BTC/USDT").
                 Crypto pairs are normalised automatically (BTC/USDT → BTC).
@@ -46,46 +86,80 @@ def fetch_stocktwits_posts(symbol: str, limit: int = 30) -> list[str]:
     clean = symbol.split("/")[0].upper()
 
     # Cache check
-    now = time.monotonic()
-    entry = _cache.get(clean)
-    if entry is not None and now < entry["expires_at"]:
-        logger.debug("StockTwits cache hit for %s (%d messages)", clean, len(entry["messages"]))
-        return entry["messages"]
+    messages = _fresh_messages(clean, time.monotonic())
+    if messages is not None:
+        logger.debug("StockTwits cache hit for %s (%d messages)", clean, len(messages))
+        return messages
+
+    with _cache_lock:
+        symbol_lock = _symbol_locks.setdefault(clean, threading.Lock())
+    with symbol_lock:
+        # Another thread may have refreshed the entry while we waited
+        now = time.monotonic()
+        messages = _fresh_messages(clean, now)
+        if messages is not None:
+            return messages
+        with _cache_lock:
+            entry = _cache.get(clean)
+        return _fetch(clean, limit, entry, now)
+
+
+def _fetch(clean: str, limit: int, entry: dict | None, now: float) -> list[str]:
+    """Request the stream from the API and update the cache."""
+    # Revalidate an expired entry with a conditional GET so an unchanged
+    # stream comes back as a bodyless 304 instead of a full JSON payload.
+    headers = {}
+    if entry is not None:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
 
     messages: list[str] = []
+    etag = last_modified = None
     try:
-        import requests
-
         url = f"https://api.stocktwits.com/api/2/streams/symbol/{clean}.json"
-        resp = requests.get(url, timeout=8, params={"limit": min(limit, 30)})
+        resp = _session.get(url, timeout=8, params={"limit": min(limit, 30)}, headers=headers)
+
+        if resp.status_code == 304 and entry is not None:
+            logger.debug("StockTwits: %s not modified, reusing cached messages", clean)
+            _store(clean, {**entry, "expires_at": now + _CACHE_TTL})
+            return entry["messages"]
 
         if resp.status_code == 429:
             logger.warning("StockTwits rate limit hit for %s — returning empty", clean)
             # Short cache so next call retries sooner
-            _cache[clean] = {"messages": [], "expires_at": now + 60}
+            _store(clean, {"messages": [], "expires_at": now + 60})
             return []
 
         if resp.status_code == 404:
             # Unknown ticker — cache indefinitely (within TTL) to avoid retries
             logger.debug("StockTwits: symbol %s not found (404)", clean)
-            _cache[clean] = {"messages": [], "expires_at": now + _CACHE_TTL}
+            _store(clean, {"messages": [], "expires_at": now + _CACHE_TTL})
             return []
 
         if resp.status_code != 200:
             logger.debug("StockTwits returned HTTP %d for %s", resp.status_code, clean)
             return []
 
-        data = resp.json()
+        data = _json_loads(resp.content)
         messages = [
             m["body"]
             for m in data.get("messages", [])
             if m.get("body") and len(m["body"].strip()) > 5
         ]
 
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
         logger.debug("StockTwits: %d messages fetched for %s", len(messages), clean)
 
     except Exception as exc:
         logger.debug("StockTwits fetch failed for %s: %s", clean, exc)
 
-    _cache[clean] = {"messages": messages, "expires_at": now + _CACHE_TTL}
+    _store(clean, {
+        "messages": messages,
+        "expires_at": now + _CACHE_TTL,
+        "etag": etag,
+        "last_modified": last_modified,
+    })
     return messages
@@ -1,26 +1,112 @@
 """WebSocket real-time price feed for crypto via ccxt pro or manual WS."""
 
+import json
 import threading
 import logging
 import time
 from datetime import datetime
+from typing import NamedTuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
-# In-memory latest prices (thread-safe via GIL for simple reads/writes)
-_latest_prices: dict[str, dict] = {}
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# In-memory latest prices as a struct-of-arrays: one contiguous float64 row
+# per field, one column per symbol. Ticks overwrite slots in place instead of
+# allocating a fresh dict; dicts are only built when a caller asks for one.
+_FIELDS = ("price", "change", "change_pct", "high_24h", "low_24h", "volume_24h")
+
+
+class _PriceBuffers(NamedTuple):
+    symbols: list[str]
+    index: dict[str, int]        # symbol → column
+    values: np.ndarray           # field × symbol
+    updated_ns: np.ndarray       # wall clock (time.time_ns), 0 = never
+    updated_mono: np.ndarray     # time.monotonic() of last update
+
+
+def _new_buffers(symbols: list[str]) -> _PriceBuffers:
+    n = len(symbols)
+    return _PriceBuffers(
+        symbols=list(symbols),
+        index={s: i for i, s in enumerate(symbols)},
+        values=np.zeros((len(_FIELDS), n)),
+        updated_ns=np.zeros(n, dtype=np.int64),
+        updated_mono=np.zeros(n),
+    )
+
+
+# Published by a single reference swap (RCU-style): readers take one local
+# reference and never see a symbol index paired with another set's arrays.
+_buffers = _new_buffers([])
+
 _ws_thread = None
-_running = False
+# Set while the feed is stopped; loops wait on it so stop_price_feed() wakes them at once
+_stop_event = threading.Event()
+_stop_event.set()
+
+
+def _init_buffers(symbols: list[str]) -> None:
+    """Publish fresh price arrays for a new symbol set."""
+    global _buffers
+    _buffers = _new_buffers(symbols)
+
+
+def _write_ticks(ticks: list[tuple[str, tuple]], stamp: tuple[int, float]) -> None:
+    """Store a batch of (symbol, field values) with one vectorised write per array.
+
+    ``stamp`` is the (time_ns, monotonic) pair shared by the whole batch.
+    """
+    buf = _buffers
+    cols, rows = [], []
+    for symbol, fields in ticks:
+        i = buf.index.get(symbol)
+        if i is not None:
+            cols.append(i)
+            rows.append(fields)
+    if not cols:
+        return
+    buf.values[:, cols] = np.array(rows, dtype=np.float64).T
+    buf.updated_ns[cols] = stamp[0]
+    buf.updated_mono[cols] = stamp[1]
+
+
+def _row(buf: _PriceBuffers, i: int) -> dict:
+    row = dict(zip(_FIELDS, buf.values[:, i].tolist()))
+    row["symbol"] = buf.symbols[i]
+    row["updated_at"] = datetime.fromtimestamp(buf.updated_ns[i] / 1e9).isoformat()
+    return row
 
 
 def get_live_price(symbol: str) -> dict | None:
     """Get the latest cached price from the WebSocket feed."""
-    return _latest_prices.get(symbol)
+    buf = _buffers
+    i = buf.index.get(symbol)
+    if i is None or not buf.updated_ns[i]:
+        return None
+    return _row(buf, i)
+
+
+def get_fresh_live_price(symbol: str, max_age: float) -> dict | None:
+    """Get the cached price only if it was updated within ``max_age`` seconds."""
+    buf = _buffers
+    i = buf.index.get(symbol)
+    if (i is None or not buf.updated_ns[i]
+            or time.monotonic() - buf.updated_mono[i] > max_age):
+        return None
+    return _row(buf, i)
 
 
 def get_all_live_prices() -> dict[str, dict]:
     """Get all cached live prices."""
-    return dict(_latest_prices)
+    buf = _buffers
+    return {buf.symbols[i]: _row(buf, i) for i in np.flatnonzero(buf.updated_ns)}
 
 
 def _ws_polling_loop(symbols: list[str], interval: float = 10.0):
@@ -28,37 +114,31 @@ def _ws_polling_loop(symbols: list[str], interval: float = 10.0):
 
     Polls every `interval` seconds for each symbol.
     """
-    global _running
     from data.crypto_fetcher import get_crypto_price
 
-    while _running:
+    while not _stop_event.is_set():
         for sym in symbols:
-            if not _running:
+            if _stop_event.is_set():
                 break
             try:
-                data = get_crypto_price(sym)
+                data = get_crypto_price(sym, use_live=False)
                 if data:
-                    _latest_prices[sym] = {
-                        **data,
-                        "updated_at": datetime.now().isoformat(),
-                    }
+                    fields = (data["price"], data["change"], data["change_pct"],
+                              data.get("high_24h") or 0, data.get("low_24h") or 0,
+                              data.get("volume_24h") or 0)
+                    _write_ticks([(sym, fields)], (time.time_ns(), time.monotonic()))
             except Exception as e:
                 logger.debug("WS poll error for %s: %s", sym, e)
-        # Sleep in small chunks for responsive shutdown
-        for _ in range(int(interval)):
-            if not _running:
-                break
-            time.sleep(1)
+        # Returns immediately when stop_price_feed() sets the event
+        if _stop_event.wait(interval):
+            break
 
 
 def _ws_okx_loop(symbols: list[str]):
     """Connect to OKX WebSocket for real-time tickers."""
-    global _running
-
     try:
         import websockets
         import asyncio
-        import json
     except ImportError:
         logger.info("websockets not installed, falling back to polling")
         _ws_polling_loop(symbols)
@@ -69,9 +149,15 @@ def _ws_okx_loop(symbols: list[str]):
 
     async def _connect():
         uri = "wss://ws.okx.com:8443/ws/v5/public"
-        while _running:
+        while not _stop_event.is_set():
             try:
-                async with websockets.connect(uri, ping_interval=20) as ws:
+                async with websockets.connect(
+                    uri, ping_interval=20,
+                    # Ticker JSON compresses well; a larger frame cap and
+                    # incoming queue keep multi-ticker bursts from backing up
+                    compression="deflate", max_size=2 ** 22, max_queue=64,
+                    write_limit=2 ** 18,
+                ) as ws:
                     # Subscribe to tickers
                     sub_msg = {
                         "op": "subscribe",
@@ -81,11 +167,15 @@ def _ws_okx_loop(symbols: list[str]):
                     logger.info("WebSocket connected to OKX for %d symbols", len(symbols))
 
                     async for message in ws:
-                        if not _running:
+                        if _stop_event.is_set():
                             break
                         try:
-                            data = json.loads(message)
+                            data = _json_loads(message)
                             if "data" in data and data.get("arg", {}).get("channel") == "tickers":
+                                # All ticks in a frame share one timestamp and
+                                # are written together in one batch
+                                stamp = (time.time_ns(), time.monotonic())
+                                ticks = []
                                 for tick in data["data"]:
                                     inst_id = tick.get("instId", "")
                                     # Convert back: BTC-USDT → BTC/USDT
@@ -95,16 +185,14 @@ def _ws_okx_loop(symbols: list[str]):
                                     change = last - open24h
                                     change_pct = (change / open24h * 100) if open24h else 0
 
-                                    _latest_prices[symbol] = {
-                                        "symbol": symbol,
-                                        "price": round(last, 2),
-                                        "change": round(change, 2),
-                                        "change_pct": round(change_pct, 2),
-                                        "high_24h": float(tick.get("high24h", 0)),
-                                        "low_24h": float(tick.get("low24h", 0)),
-                                        "volume_24h": float(tick.get("volCcy24h", 0)),
-                                        "updated_at": datetime.now().isoformat(),
-                                    }
+                                    ticks.append((symbol, (
+                                        round(last, 2), round(change, 2),
+                                        round(change_pct, 2),
+                                        float(tick.get("high24h", 0)),
+                                        float(tick.get("low24h", 0)),
+                                        float(tick.get("volCcy24h", 0)),
+                                    )))
+                                _write_ticks(ticks, stamp)
                         except (json.JSONDecodeError, KeyError, ValueError):
                             continue
             except Exception as e:
@@ -120,16 +208,17 @@ def _ws_okx_loop(symbols: list[str]):
 
 def start_price_feed(symbols: list[str] = None, use_websocket: bool = True):
     """Start the real-time price feed in a background thread."""
-    global _ws_thread, _running
+    global _ws_thread
 
-    if _running:
+    if not _stop_event.is_set():
         return
 
     if symbols is None:
         from config import DEFAULT_CRYPTO
         symbols = DEFAULT_CRYPTO
 
-    _running = True
+    _init_buffers(symbols)
+    _stop_event.clear()
     target = _ws_okx_loop if use_websocket else _ws_polling_loop
     _ws_thread = threading.Thread(
         target=target,
@@ -144,10 +233,9 @@ def start_price_feed(symbols: list[str] = None, use_websocket: bool = True):
 
 def stop_price_feed():
     """Stop the price feed."""
-    global _running
-    _running = False
+    _stop_event.set()
     logger.info("Price feed stopped")
 
 
 def is_feed_running() -> bool:
-    return _running
+    return not _stop_event.is_set()
@@ -2,25 +2,81 @@
 
 import logging
 import sqlite3
+import threading
 from contextlib import contextmanager
-from config import DB_PATH
+from contextvars import ContextVar
+from functools import wraps
+from config import DB_PATH, DB_MMAP_SIZE
+from db.pool import ConnectionPool
 
 logger = logging.getLogger(__name__)
 
+# Stored in PRAGMA user_version by _migrate_db(); bump it (and add a step
+# there if existing files need more than the CREATE ... IF NOT EXISTS DDL)
+# whenever the schema changes.
+SCHEMA_VERSION = 2
+
+# Per-connection settings (unlike journal_mode, these do not persist in the file).
+# synchronous=NORMAL is safe under WAL: a power loss can only drop the last commits.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=30000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",  # 64 MB page cache (negative = KiB)
+    f"PRAGMA mmap_size={DB_MMAP_SIZE:d}",
+    # WAL is normally checkpointed in the background (start_wal_checkpointer);
+    # the raised auto threshold (~40 MB) is only a backstop for writers.
+    "PRAGMA wal_autocheckpoint=10000",
+)
+
 
 def get_connection() -> sqlite3.Connection:
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(DB_PATH), timeout=10)
+    # Pooled connections live long enough for their prepared-statement cache
+    # to matter; size it above the number of distinct queries the app issues.
+    conn = sqlite3.connect(str(DB_PATH), check_same_thread=False,
+                           cached_statements=256)
     conn.row_factory = sqlite3.Row
     # journal_mode=WAL is a persistent database-level setting; set once in
     # init_db() so we avoid the round-trip on every connection.
-    conn.execute("PRAGMA foreign_keys=ON")
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def get_ro_connection() -> sqlite3.Connection:
+    """Open a read-only connection; under WAL it never waits on the writer lock."""
+    conn = sqlite3.connect(f"{DB_PATH.as_uri()}?mode=ro", uri=True,
+                           check_same_thread=False, cached_statements=256)
+    conn.row_factory = sqlite3.Row
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    conn.execute("PRAGMA query_only=ON")
+    if DB_MMAP_SIZE and not conn.execute("PRAGMA mmap_size").fetchone()[0]:
+        # SQLite silently ignores the request when built without mmap support
+        logger.debug("mmap I/O unavailable in this SQLite build; using read() paging")
     return conn
 
 
+# Connections are reused across get_db() calls so the open and PRAGMA setup
+# is paid once per pooled connection rather than once per helper call.
+_pool = ConnectionPool(get_connection, maxsize=8)
+_ro_pool = ConnectionPool(get_ro_connection, maxsize=4)
+
+
+# Connection of the enclosing transaction()/@transactional block, if any
+_current_conn: ContextVar[sqlite3.Connection | None] = ContextVar("_current_conn", default=None)
+
+
 @contextmanager
 def get_db():
-    conn = get_connection()
+    outer = _current_conn.get()
+    if outer is not None:
+        # Join the enclosing transaction; it commits or rolls back once at the end
+        yield outer
+        return
+    conn = _pool.acquire()
     try:
         yield conn
         conn.commit()
@@ -29,17 +85,58 @@ def get_db():
         conn.rollback()
         raise
     finally:
-        conn.close()
+        _pool.release(conn)
 
 
-def init_db():
-    """Create all tables if they don't exist."""
+@contextmanager
+def get_ro_db():
+    """Like get_db() for pure reads: a pooled read-only connection, no commit.
+
+    The database must already exist (ensure_schema() creates it at startup).
+    Inside transaction() the enclosing connection is used so reads see its
+    uncommitted writes.
+    """
+    outer = _current_conn.get()
+    if outer is not None:
+        yield outer
+        return
+    conn = _ro_pool.acquire()
+    try:
+        yield conn
+    except Exception:
+        logger.exception("Read-only database operation failed")
+        raise
+    finally:
+        _ro_pool.release(conn)
+
+
+@contextmanager
+def transaction():
+    """Run every get_db()/get_ro_db() call in the block on one connection, with one commit."""
+    if _current_conn.get() is not None:
+        yield
+        return
     with get_db() as conn:
-        # Set WAL mode once; it persists at the database file level across
-        # all future connections, so there is no need to repeat it per-connection.
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.executescript("""
-        -- Price data cache
+        token = _current_conn.set(conn)
+        try:
+            yield
+        finally:
+            _current_conn.reset(token)
+
+
+def transactional(fn):
+    """Decorator form of transaction()."""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        with transaction():
+            return fn(*args, **kwargs)
+    return wrapper
+
+
+# Schema statements, applied in order by init_db() inside one transaction.
+SCHEMA_DDL = [
+    # Price data cache
+    """
         CREATE TABLE IF NOT EXISTS price_cache (
             symbol TEXT NOT NULL,
             date TEXT NOT NULL,
@@ -48,9 +145,10 @@ def init_db():
             asset_type TEXT DEFAULT 'stock',
             fetched_at TEXT DEFAULT (datetime('now')),
             PRIMARY KEY (symbol, date, asset_type)
-        );
-
-        -- News cache
+        )
+    """,
+    # News cache
+    """
         CREATE TABLE IF NOT EXISTS news_cache (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             symbol TEXT,
@@ -60,9 +158,10 @@ def init_db():
             url TEXT,
             published_at TEXT,
             fetched_at TEXT DEFAULT (datetime('now'))
-        );
-
-        -- Sentiment scores
+        )
+    """,
+    # Sentiment scores
+    """
         CREATE TABLE IF NOT EXISTS sentiment_scores (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             symbol TEXT NOT NULL,
@@ -71,9 +170,10 @@ def init_db():
             label TEXT,
             text_snippet TEXT,
             computed_at TEXT DEFAULT (datetime('now'))
-        );
-
-        -- ML predictions
+        )
+    """,
+    # ML predictions
+    """
         CREATE TABLE IF NOT EXISTS ml_predictions (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             symbol TEXT NOT NULL,
@@ -82,9 +182,10 @@ def init_db():
             confidence REAL,
             predicted_at TEXT DEFAULT (datetime('now')),
             target_date TEXT
-        );
-
-        -- Trading signals
+        )
+    """,
+    # Trading signals
+    """
         CREATE TABLE IF NOT EXISTS signals (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             symbol TEXT NOT NULL,
@@ -103,9 +204,10 @@ def init_db():
             outcome_return_10d REAL,
             outcome_correct INTEGER,
             outcome_checked_at TEXT
-        );
-
-        -- Portfolio holdings
+        )
+    """,
+    # Portfolio holdings
+    """
         CREATE TABLE IF NOT EXISTS holdings (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             symbol TEXT NOT NULL UNIQUE,
@@ -115,9 +217,10 @@ def init_db():
             entry_date TEXT,
             stop_loss REAL,
             sector TEXT
-        );
-
-        -- Portfolio transactions
+        )
+    """,
+    # Portfolio transactions
+    """
         CREATE TABLE IF NOT EXISTS transactions (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             symbol TEXT NOT NULL,
@@ -126,9 +229,10 @@ def init_db():
             price REAL NOT NULL,
             executed_at TEXT DEFAULT (datetime('now')),
             note TEXT
-        );
-
-        -- Backtest results
+        )
+    """,
+    # Backtest results
+    """
         CREATE TABLE IF NOT EXISTS backtest_results (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT,
@@ -141,15 +245,17 @@ def init_db():
             total_trades INTEGER,
             equity_curve TEXT,
             created_at TEXT DEFAULT (datetime('now'))
-        );
-
-        -- User settings
+        )
+    """,
+    # User settings
+    """
         CREATE TABLE IF NOT EXISTS settings (
             key TEXT PRIMARY KEY,
             value TEXT NOT NULL
-        );
-
-        -- Risk alerts
+        )
+    """,
+    # Risk alerts
+    """
         CREATE TABLE IF NOT EXISTS risk_alerts (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             alert_type TEXT NOT NULL,
@@ -158,23 +264,44 @@ def init_db():
             symbol TEXT,
             created_at TEXT DEFAULT (datetime('now')),
             acknowledged INTEGER DEFAULT 0
-        );
-
-        -- Indexes
-        CREATE INDEX IF NOT EXISTS idx_price_symbol   ON price_cache(symbol);
-        CREATE INDEX IF NOT EXISTS idx_signals_symbol  ON signals(symbol);
-        CREATE INDEX IF NOT EXISTS idx_signals_created ON signals(created_at);
-        CREATE INDEX IF NOT EXISTS idx_news_symbol     ON news_cache(symbol);
-
-        -- Indexes for accuracy_tracker queries
-        -- get_unchecked_signals: WHERE outcome_checked_at IS NULL AND created_at <= ?
+        )
+    """,
+    # Indexes
+    "CREATE INDEX IF NOT EXISTS idx_price_symbol   ON price_cache(symbol)",
+    "CREATE INDEX IF NOT EXISTS idx_signals_created ON signals(created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_news_symbol     ON news_cache(symbol)",
+    # get_signal_history: WHERE symbol=? AND created_at >= ? ORDER BY created_at
+    # (also serves plain symbol lookups, replacing idx_signals_symbol)
+    """
+        CREATE INDEX IF NOT EXISTS idx_signals_sym_created
+            ON signals(symbol, created_at)
+    """,
+    # Indexes for cache_manager freshness lookups (filter + ORDER BY ... DESC)
+    """
+        CREATE INDEX IF NOT EXISTS idx_price_sym_type_date
+            ON price_cache(symbol, asset_type, date DESC)
+    """,
+    """
+        CREATE INDEX IF NOT EXISTS idx_news_sym_fetched
+            ON news_cache(symbol, fetched_at DESC)
+    """,
+    """
+        CREATE INDEX IF NOT EXISTS idx_sentiment_sym_computed
+            ON sentiment_scores(symbol, computed_at DESC)
+    """,
+    # Indexes for accuracy_tracker queries
+    # get_unchecked_signals: WHERE outcome_checked_at IS NULL AND created_at <= ?
+    """
         CREATE INDEX IF NOT EXISTS idx_signals_unchecked
-            ON signals(outcome_checked_at, created_at);
-        -- compute_adaptive_weights: WHERE outcome_correct IS NOT NULL AND direction != 'HOLD'
+            ON signals(outcome_checked_at, created_at)
+    """,
+    # compute_adaptive_weights: WHERE outcome_correct IS NOT NULL AND direction != 'HOLD'
+    """
         CREATE INDEX IF NOT EXISTS idx_signals_outcome_dir
-            ON signals(outcome_correct, direction);
-
-        -- Paper trading: virtual positions
+            ON signals(outcome_correct, direction)
+    """,
+    # Paper trading: virtual positions
+    """
         CREATE TABLE IF NOT EXISTS paper_positions (
             id          INTEGER PRIMARY KEY AUTOINCREMENT,
             symbol      TEXT    NOT NULL,
@@ -189,9 +316,10 @@ def init_db():
             closed_at   TEXT,
             close_price REAL,
             realized_pnl REAL   DEFAULT 0
-        );
-
-        -- Paper trading: virtual trade log
+        )
+    """,
+    # Paper trading: virtual trade log
+    """
         CREATE TABLE IF NOT EXISTS paper_trades (
             id          INTEGER PRIMARY KEY AUTOINCREMENT,
             symbol      TEXT    NOT NULL,
@@ -201,23 +329,109 @@ def init_db():
             pnl         REAL    DEFAULT 0,
             reason      TEXT,
             executed_at TEXT    NOT NULL DEFAULT (datetime('now'))
-        );
+        )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_paper_pos_symbol ON paper_positions(symbol, status)",
+    "CREATE INDEX IF NOT EXISTS idx_paper_trades_sym ON paper_trades(symbol)",
+]
+
 
-        CREATE INDEX IF NOT EXISTS idx_paper_pos_symbol ON paper_positions(symbol, status);
-        CREATE INDEX IF NOT EXISTS idx_paper_trades_sym ON paper_trades(symbol);
-        """)
+def init_db():
+    """Create all tables if they don't exist."""
+    # Set WAL mode once; it persists at the database file level across all
+    # future connections. It cannot change inside a transaction, so it runs first.
+    with get_db() as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+    with get_db() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        for stmt in SCHEMA_DDL:
+            conn.execute(stmt)
 
 
 def _migrate_db():
-    """Apply schema migrations for columns added after initial release."""
+    """Upgrade an existing database to SCHEMA_VERSION.
+
+    Steps are keyed on PRAGMA user_version, so a current file costs one
+    integer read and each step runs once, atomically with the version bump.
+    """
     with get_db() as conn:
-        existing_cols = {row[1] for row in conn.execute("PRAGMA table_info(signals)").fetchall()}
-        if "macro_score" not in existing_cols:
-            conn.execute("ALTER TABLE signals ADD COLUMN macro_score REAL")
-        if "macro_regime" not in existing_cols:
-            conn.execute("ALTER TABLE signals ADD COLUMN macro_regime TEXT")
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+        conn.execute("BEGIN IMMEDIATE")
+
+        if version < 1:
+            # Files from before schema versioning: columns added after initial release
+            existing_cols = {row[1] for row in conn.execute("PRAGMA table_info(signals)").fetchall()}
+            if "macro_score" not in existing_cols:
+                conn.execute("ALTER TABLE signals ADD COLUMN macro_score REAL")
+            if "macro_regime" not in existing_cols:
+                conn.execute("ALTER TABLE signals ADD COLUMN macro_regime TEXT")
+
+            # news_cache dedupe: drop historical duplicates before adding the unique key
+            has_news_key = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='index' AND name='uniq_news_symbol_title'"
+            ).fetchone()
+            if not has_news_key:
+                conn.execute("""
+                    DELETE FROM news_cache WHERE id NOT IN (
+                        SELECT MAX(id) FROM news_cache GROUP BY symbol, title
+                    )
+                """)
+                conn.execute(
+                    "CREATE UNIQUE INDEX uniq_news_symbol_title ON news_cache(symbol, title)"
+                )
+
+        if version < 2:
+            # Superseded by idx_signals_sym_created
+            conn.execute("DROP INDEX IF EXISTS idx_signals_symbol")
+
+        conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+
+def ensure_schema():
+    """Create or migrate the schema unless the database is already current.
+
+    Call once at startup; on an up-to-date file this is a single PRAGMA read.
+    """
+    with get_db() as conn:
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+            return
+    init_db()
+    _migrate_db()
+
+
+_checkpoint_thread = None
+_checkpoint_stop = threading.Event()
+
+
+def _checkpoint_loop(interval: float):
+    while not _checkpoint_stop.wait(interval):
+        try:
+            with get_db() as conn:
+                busy, wal_pages, done = conn.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchone()
+                # Everything copied back and nobody in the way: reset the WAL file
+                if not busy and wal_pages > 0 and done == wal_pages:
+                    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except Exception as e:
+            logger.warning("WAL checkpoint failed: %s", e)
+
+
+def start_wal_checkpointer(interval: float = 30.0):
+    """Checkpoint the WAL every ``interval`` seconds on a background thread.
+
+    PASSIVE checkpoints never block readers or writers, so commits stop
+    paying for the automatic checkpoint.
+    """
+    global _checkpoint_thread
+    if _checkpoint_thread is not None and _checkpoint_thread.is_alive():
+        return
+    _checkpoint_stop.clear()
+    _checkpoint_thread = threading.Thread(
+        target=_checkpoint_loop, args=(interval,), daemon=True, name="wal_checkpointer",
+    )
+    _checkpoint_thread.start()
 
 
-# Initialize on import
-init_db()
-_migrate_db()
+def stop_wal_checkpointer():
+    _checkpoint_stop.set()
@@ -2,51 +2,102 @@
 
 import json
 import logging
-from datetime import datetime
-from db.database import get_db
+import threading
+from itertools import combinations
+from db.database import get_db, get_ro_db
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+def _select_list(columns) -> str:
+    """Column list for a SELECT; ``None`` selects every column."""
+    if columns is None:
+        return "*"
+    if not columns or not all(c.isidentifier() for c in columns):
+        raise ValueError(f"Invalid column list: {columns!r}")
+    return ", ".join(columns)
+
+
+def _rows(rows: list, as_dict: bool) -> list:
+    """Convert fetched rows to dicts, or return the sqlite3.Row objects as-is.
+
+    Rows support ``row["col"]`` and ``row[0]`` but not ``.get()``; pass
+    ``as_dict=False`` only where the caller indexes by key.
+    """
+    return [dict(r) for r in rows] if as_dict else rows
+
 
 # ── Settings ──────────────────────────────────────────────────────────
 
+# Stored JSON text per key (None = no row). set_setting() is the only writer,
+# so invalidating there keeps the cache exact. The text rather than the
+# decoded value is cached so each caller still gets its own list/dict.
+_settings_cache: dict[str, str | None] = {}
+_settings_gen = 0  # bumped by every write; a read racing a write is not cached
+_settings_lock = threading.Lock()
+
+
 def get_setting(key: str, default=None):
-    with get_db() as conn:
-        row = conn.execute("SELECT value FROM settings WHERE key=?", (key,)).fetchone()
-        if row:
-            try:
-                return json.loads(row["value"])
-            except (json.JSONDecodeError, TypeError):
-                logger.warning("Failed to decode JSON for setting '%s', returning raw value", key)
-                return row["value"]
+    try:
+        raw = _settings_cache[key]
+    except KeyError:
+        gen = _settings_gen
+        with get_ro_db() as conn:
+            row = conn.execute("SELECT value FROM settings WHERE key=?", (key,)).fetchone()
+        raw = row["value"] if row else None
+        with _settings_lock:
+            if gen == _settings_gen:
+                _settings_cache[key] = raw
+    if raw is None:
         return default
+    try:
+        return json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        logger.warning("Failed to decode JSON for setting '%s', returning raw value", key)
+        return raw
 
 
 def set_setting(key: str, value):
+    global _settings_gen
+    _settings_gen += 1
     with get_db() as conn:
         conn.execute(
             "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
             (key, json.dumps(value)),
         )
+    with _settings_lock:
+        _settings_gen += 1
+        _settings_cache.pop(key, None)
 
 
 # ── Holdings ──────────────────────────────────────────────────────────
 
-def get_holdings():
-    with get_db() as conn:
-        return [dict(r) for r in conn.execute("SELECT * FROM holdings ORDER BY symbol").fetchall()]
+def get_holdings(columns: tuple[str, ...] | None = None):
+    """All holdings ordered by symbol; ``columns`` limits the fields fetched."""
+    cols = _select_list(columns)
+    with get_ro_db() as conn:
+        return [dict(r) for r in conn.execute(
+            f"SELECT {cols} FROM holdings ORDER BY symbol"
+        ).fetchall()]
 
 
-def upsert_holding(symbol, asset_type, quantity, avg_cost, sector=None):
+def upsert_holding(symbol, asset_type, quantity, avg_cost, sector=None, entry_date=None):
+    # entry_date defaults to today, like paper_positions; kept on update
     with get_db() as conn:
         conn.execute("""
             INSERT INTO holdings (symbol, asset_type, quantity, avg_cost, entry_date, sector)
-            VALUES (?, ?, ?, ?, ?, ?)
+            VALUES (?, ?, ?, ?, COALESCE(?, date('now')), ?)
             ON CONFLICT(symbol) DO UPDATE SET
                 quantity=excluded.quantity,
                 avg_cost=excluded.avg_cost,
                 sector=excluded.sector
-        """, (symbol, asset_type, quantity, avg_cost, datetime.now().isoformat(), sector))
+        """, (symbol, asset_type, quantity, avg_cost, entry_date, sector))
 
 
 def remove_holding(symbol):
@@ -64,38 +115,56 @@ def add_transaction(symbol, action, quantity, price, note=""):
         )
 
 
-def get_transactions(limit=100):
-    with get_db() as conn:
-        return [dict(r) for r in conn.execute(
+def get_transactions(limit=100, as_dict=True):
+    with get_ro_db() as conn:
+        rows = conn.execute(
             "SELECT * FROM transactions ORDER BY executed_at DESC LIMIT ?", (limit,)
-        ).fetchall()]
+        ).fetchall()
+    return _rows(rows, as_dict)
 
 
 # ── Signals ───────────────────────────────────────────────────────────
 
+_INSERT_SIGNAL = """
+    INSERT INTO signals (symbol, signal_type, direction, strength,
+        confidence, technical_score, sentiment_score, ml_score,
+        macro_score, macro_regime)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 def save_signal(symbol, signal_type, direction, strength, confidence,
                 technical_score=None, sentiment_score=None, ml_score=None,
                 macro_score=None, macro_regime=None):
     with get_db() as conn:
-        conn.execute("""
-            INSERT INTO signals (symbol, signal_type, direction, strength,
-                confidence, technical_score, sentiment_score, ml_score,
-                macro_score, macro_regime)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (symbol, signal_type, direction, strength, confidence,
-              technical_score, sentiment_score, ml_score,
-              macro_score, macro_regime))
+        conn.execute(_INSERT_SIGNAL, (symbol, signal_type, direction, strength, confidence,
+                                      technical_score, sentiment_score, ml_score,
+                                      macro_score, macro_regime))
+
 
+def save_signals_bulk(rows: list[tuple]) -> None:
+    """Insert many signals in one transaction.
 
-def get_latest_signals(limit=50):
+    Each row follows save_signal's positional order: (symbol, signal_type,
+    direction, strength, confidence, technical_score, sentiment_score,
+    ml_score, macro_score, macro_regime).
+    """
+    if not rows:
+        return
     with get_db() as conn:
-        return [dict(r) for r in conn.execute(
+        conn.executemany(_INSERT_SIGNAL, rows)
+
+
+def get_latest_signals(limit=50, as_dict=True):
+    with get_ro_db() as conn:
+        rows = conn.execute(
             "SELECT * FROM signals ORDER BY created_at DESC LIMIT ?", (limit,)
-        ).fetchall()]
+        ).fetchall()
+    return _rows(rows, as_dict)
 
 
 def get_signal_history(symbol, days=90):
-    with get_db() as conn:
+    with get_ro_db() as conn:
         return [dict(r) for r in conn.execute("""
             SELECT * FROM signals WHERE symbol=?
             AND created_at >= datetime('now', ?)
@@ -105,21 +174,33 @@ def get_signal_history(symbol, days=90):
 
 # ── Risk Alerts ───────────────────────────────────────────────────────
 
+_INSERT_RISK_ALERT = "INSERT INTO risk_alerts (alert_type, severity, message, symbol) VALUES (?, ?, ?, ?)"
+
+
 def add_risk_alert(alert_type, severity, message, symbol=None):
     with get_db() as conn:
-        conn.execute(
-            "INSERT INTO risk_alerts (alert_type, severity, message, symbol) VALUES (?, ?, ?, ?)",
-            (alert_type, severity, message, symbol),
-        )
+        conn.execute(_INSERT_RISK_ALERT, (alert_type, severity, message, symbol))
 
 
-def get_risk_alerts(limit=50, unacknowledged_only=False):
+def add_risk_alerts_bulk(rows: list[tuple]) -> None:
+    """Insert many (alert_type, severity, message, symbol) alerts in one transaction."""
+    if not rows:
+        return
     with get_db() as conn:
-        query = "SELECT * FROM risk_alerts"
-        if unacknowledged_only:
-            query += " WHERE acknowledged=0"
-        query += " ORDER BY created_at DESC LIMIT ?"
-        return [dict(r) for r in conn.execute(query, (limit,)).fetchall()]
+        conn.executemany(_INSERT_RISK_ALERT, rows)
+
+
+_Q_RISK_ALERTS = "SELECT * FROM risk_alerts ORDER BY created_at DESC LIMIT ?"
+_Q_RISK_ALERTS_UNACK = (
+    "SELECT * FROM risk_alerts WHERE acknowledged=0 ORDER BY created_at DESC LIMIT ?"
+)
+
+
+def get_risk_alerts(limit=50, unacknowledged_only=False, as_dict=True):
+    query = _Q_RISK_ALERTS_UNACK if unacknowledged_only else _Q_RISK_ALERTS
+    with get_ro_db() as conn:
+        rows = conn.execute(query, (limit,)).fetchall()
+    return _rows(rows, as_dict)
 
 
 # ── Backtest Results ──────────────────────────────────────────────────
@@ -137,15 +218,17 @@ def save_backtest(name, config, total_return, annual_return, sharpe_ratio,
 
 # ── Paper Trading ─────────────────────────────────────────────────────
 
-def get_paper_positions(status: str = "open") -> list[dict]:
-    with get_db() as conn:
+def get_paper_positions(status: str = "open",
+                        columns: tuple[str, ...] | None = None) -> list[dict]:
+    cols = _select_list(columns)
+    with get_ro_db() as conn:
         if status == "all":
             rows = conn.execute(
-                "SELECT * FROM paper_positions ORDER BY opened_at DESC"
+                f"SELECT {cols} FROM paper_positions ORDER BY opened_at DESC"
             ).fetchall()
         else:
             rows = conn.execute(
-                "SELECT * FROM paper_positions WHERE status=? ORDER BY opened_at DESC",
+                f"SELECT {cols} FROM paper_positions WHERE status=? ORDER BY opened_at DESC",
                 (status,),
             ).fetchall()
         return [dict(r) for r in rows]
@@ -154,28 +237,36 @@ def get_paper_positions(status: str = "open") -> list[dict]:
 def open_paper_position(symbol: str, entry_price: float, quantity: float,
                         stop_loss: float | None = None) -> int:
     with get_db() as conn:
-        cur = conn.execute("""
+        row = conn.execute("""
             INSERT INTO paper_positions
                 (symbol, entry_date, entry_price, quantity, stop_loss,
                  trailing_stop, highest_price, status)
             VALUES (?, date('now'), ?, ?, ?, ?, ?, 'open')
+            RETURNING id
         """, (symbol, entry_price, quantity, stop_loss,
               entry_price * 0.95,   # default trailing stop 5%
-              entry_price))
-        return cur.lastrowid
+              entry_price)).fetchone()
+        return row[0]
+
+
+_POSITION_UPDATABLE = ("stop_loss", "trailing_stop", "highest_price")
+# One fixed UPDATE per column subset, so every call hits the statement cache:
+# frozenset(columns) → (sql, columns in bind order)
+_POSITION_UPDATE_SQL = {
+    frozenset(cols): (f"UPDATE paper_positions SET {', '.join(f'{c}=?' for c in cols)} WHERE id=?",
+                      cols)
+    for n in range(1, len(_POSITION_UPDATABLE) + 1)
+    for cols in combinations(_POSITION_UPDATABLE, n)
+}
 
 
 def update_paper_position(position_id: int, **kwargs) -> None:
-    allowed = {"stop_loss", "trailing_stop", "highest_price"}
-    updates = {k: v for k, v in kwargs.items() if k in allowed}
-    if not updates:
+    key = frozenset(kwargs.keys() & _POSITION_UPDATABLE)
+    if not key:
         return
-    cols = ", ".join(f"{k}=?" for k in updates)
+    sql, cols = _POSITION_UPDATE_SQL[key]
     with get_db() as conn:
-        conn.execute(
-            f"UPDATE paper_positions SET {cols} WHERE id=?",
-            (*updates.values(), position_id),
-        )
+        conn.execute(sql, (*(kwargs[c] for c in cols), position_id))
 
 
 def close_paper_position(position_id: int, close_price: float,
@@ -189,20 +280,60 @@ def close_paper_position(position_id: int, close_price: float,
         """, (close_price, realized_pnl, position_id))
 
 
+_INSERT_PAPER_TRADE = """
+    INSERT INTO paper_trades (symbol, action, price, quantity, pnl, reason)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
 def add_paper_trade(symbol: str, action: str, price: float,
                     quantity: float, pnl: float = 0, reason: str = "") -> None:
     with get_db() as conn:
-        conn.execute("""
-            INSERT INTO paper_trades (symbol, action, price, quantity, pnl, reason)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (symbol, action, price, quantity, pnl, reason))
+        conn.execute(_INSERT_PAPER_TRADE, (symbol, action, price, quantity, pnl, reason))
 
 
-def get_paper_trades(limit: int = 100) -> list[dict]:
+def add_paper_trades_bulk(rows: list[tuple]) -> None:
+    """Insert many (symbol, action, price, quantity, pnl, reason) trades in one transaction."""
+    if not rows:
+        return
     with get_db() as conn:
-        return [dict(r) for r in conn.execute(
-            "SELECT * FROM paper_trades ORDER BY executed_at DESC LIMIT ?", (limit,)
-        ).fetchall()]
+        conn.executemany(_INSERT_PAPER_TRADE, rows)
+
+
+def get_paper_trades(limit: int = 100,
+                     columns: tuple[str, ...] | None = None,
+                     as_dict: bool = True) -> list:
+    cols = _select_list(columns)
+    with get_ro_db() as conn:
+        rows = conn.execute(
+            f"SELECT {cols} FROM paper_trades ORDER BY executed_at DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+    return _rows(rows, as_dict)
+
+
+def iter_paper_trades(columns: tuple[str, ...] | None = None):
+    """Yield paper trades newest first as sqlite3.Row objects, without materialising them all.
+
+    The pooled connection is held until the generator is exhausted or closed.
+    """
+    cols = _select_list(columns)
+    with get_ro_db() as conn:
+        yield from conn.execute(
+            f"SELECT {cols} FROM paper_trades ORDER BY executed_at DESC"
+        )
+
+
+def get_paper_trade_stats() -> dict:
+    """Aggregate realized P&L, wins and count over all closed (SELL/STOP) trades."""
+    with get_ro_db() as conn:
+        row = conn.execute("""
+            SELECT COALESCE(SUM(pnl), 0)                         AS total_pnl,
+                   COALESCE(SUM(CASE WHEN pnl > 0 THEN 1 END), 0) AS wins,
+                   COUNT(*)                                      AS n_closed
+            FROM paper_trades WHERE action IN ('SELL', 'STOP')
+        """).fetchone()
+        return dict(row)
 
 
 def reset_paper_portfolio() -> None:
@@ -212,18 +343,28 @@ def reset_paper_portfolio() -> None:
         conn.execute("DELETE FROM paper_trades")
 
 
+def _decode_json_column(raw, empty):
+    """Decode a stored JSON column, returning ``empty`` for missing or bad data."""
+    if not raw:
+        return empty
+    try:
+        return _json_loads(raw)
+    except (ValueError, TypeError):
+        pass
+    try:
+        # json.dumps writes NaN/Infinity, which orjson rejects
+        return json.loads(raw)
+    except (ValueError, TypeError):
+        return empty
+
+
 def get_backtest_results(limit=20):
-    with get_db() as conn:
+    with get_ro_db() as conn:
         rows = [dict(r) for r in conn.execute(
             "SELECT * FROM backtest_results ORDER BY created_at DESC LIMIT ?", (limit,)
         ).fetchall()]
-        for r in rows:
-            try:
-                r["config"] = json.loads(r["config"]) if r["config"] else {}
-            except (json.JSONDecodeError, TypeError):
-                r["config"] = {}
-            try:
-                r["equity_curve"] = json.loads(r["equity_curve"]) if r["equity_curve"] else []
-            except (json.JSONDecodeError, TypeError):
-                r["equity_curve"] = []
-        return rows
+    # Decoding (equity curves can be long) happens after the connection is returned
+    for r in rows:
+        r["config"] = _decode_json_column(r["config"], {})
+        r["equity_curve"] = _decode_json_column(r["equity_curve"], [])
+    return rows
@@ -0,0 +1,51 @@
+"""Bounded pool of reusable SQLite connections."""
+
+import atexit
+import logging
+import queue
+import sqlite3
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionPool:
+    """LIFO pool of connections built by ``factory``.
+
+    A connection is handed to one caller at a time, so it can move between
+    threads (the factory must open it with ``check_same_thread=False``).
+    LIFO order keeps the most recently used, warmest connection in service.
+    When the pool is empty a new connection is opened; when it is full on
+    release the surplus connection is closed.
+    """
+
+    def __init__(self, factory: Callable[[], sqlite3.Connection], maxsize: int = 8):
+        self._factory = factory
+        self._idle: queue.LifoQueue = queue.LifoQueue(maxsize=maxsize)
+        atexit.register(self.close_all)
+
+    def acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._factory()
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        if conn.in_transaction:
+            # Never hand out a connection with a half-finished transaction
+            conn.rollback()
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close_all(self) -> None:
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                logger.debug("Error closing pooled connection: %s", e)
@@ -1,7 +1,9 @@
 """Centralized logging configuration for AI Investment System."""
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 from config import BASE_DIR, LOG_LEVEL, LOG_DIR
@@ -12,6 +14,9 @@ _initialized = False
 def setup_logging(level: str | None = None):
     """Configure the root logger with console and file handlers.
 
+    Records are queued on the calling thread and written by a background
+    listener, so a slow disk never stalls the code that logs.
+
     Args:
         level: Override log level (e.g. "DEBUG", "INFO"). Defaults to config.LOG_LEVEL.
     """
@@ -31,7 +36,6 @@ def setup_logging(level: str | None = None):
     console = logging.StreamHandler()
     console.setLevel(log_level)
     console.setFormatter(fmt)
-    root.addHandler(console)
 
     # File handler (DEBUG+, rotating 5 MB x 3 backups)
     log_dir = BASE_DIR / LOG_DIR
@@ -44,7 +48,12 @@ def setup_logging(level: str | None = None):
     )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(fmt)
-    root.addHandler(file_handler)
+
+    log_queue = queue.SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, console, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # flush queued records on exit
 
     # Suppress noisy third-party loggers
     for name in ("yfinance", "ccxt", "urllib3", "peewee", "matplotlib"):
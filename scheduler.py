@@ -1,8 +1,14 @@
 """Scheduler: automatic data refresh and daily signal generation."""
 
+import hashlib
 import threading
 import logging
+from collections import Counter, OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
 from datetime import datetime
+from itertools import zip_longest
+from types import MappingProxyType
 
 from logger import setup_logging
 
@@ -10,15 +16,99 @@ setup_logging()
 logger = logging.getLogger(__name__)
 
 _scheduler_thread = None
-_running = False
 _stop_event = threading.Event()
-
-_NEUTRAL_SIGNAL = {"score": 0, "confidence": 0.3}
-
-
-def _build_sentiment_signal(symbol: str, asset_type: str) -> dict:
+_scheduler_lock = threading.Lock()
+
+# Read-only: the same placeholder is handed out for every failed signal, so
+# a caller mutating it would change it for every other symbol
+_NEUTRAL_SIGNAL = MappingProxyType({"score": 0.0, "confidence": 0.3})
+
+_SCAN_WORKERS = 8          # symbols processed concurrently
+_SCAN_TIMEOUT = 30 * 60    # seconds allowed for the whole per-symbol phase
+_GLOBAL_FETCH_TIMEOUT = 60  # seconds to wait for each global (market-wide) signal
+_HISTORY_DAYS = 730         # daily bars of history each symbol is scored on
+_HISTORY_MIN_SPAN = 720     # cached history shorter than this is fetched in full
+
+# Worker threads are kept for the life of the process and shared by every
+# scan (scheduled or manual), rather than spun up and torn down per scan.
+# A task that hangs past its scan's timeout keeps its worker, so tasks
+# still running are counted per pool; each scan logs any left over from
+# earlier scans and swaps in a fresh pool once they would starve it.
+_scan_executor = ThreadPoolExecutor(max_workers=_SCAN_WORKERS, thread_name_prefix="scan")
+_scan_busy: Counter = Counter()  # executor → tasks currently running on it
+_scan_pool_lock = threading.Lock()
+
+
+def _scan_submit(fn, *args):
+    """Submit scan work to the shared pool, counted while it runs."""
+    executor = _scan_executor
+
+    def run():
+        with _scan_pool_lock:
+            _scan_busy[executor] += 1
+        try:
+            return fn(*args)
+        finally:
+            with _scan_pool_lock:
+                _scan_busy[executor] -= 1
+                if not _scan_busy[executor]:
+                    del _scan_busy[executor]
+
+    return executor.submit(run)
+
+
+def _check_scan_pool():
+    """Log workers still held by earlier scans; replace the pool if starved."""
+    global _scan_executor
+    with _scan_pool_lock:
+        stuck = _scan_busy[_scan_executor]
+        if not stuck:
+            return
+        logger.warning("%d/%d scan workers still busy from an earlier scan",
+                       stuck, _SCAN_WORKERS)
+        if stuck >= _SCAN_WORKERS // 2:
+            logger.warning("Scan pool starved by hung tasks; starting a fresh pool")
+            # Queued work (e.g. a scan still running) finishes on the old pool
+            _scan_executor.shutdown(wait=False)
+            _scan_executor = ThreadPoolExecutor(max_workers=_SCAN_WORKERS,
+                                                thread_name_prefix="scan")
+
+# Sentiment and ML results keyed by their inputs, so a symbol whose news or
+# latest bar is unchanged since the previous scan skips NLP / inference.
+_RESULT_CACHE_MAX = 512
+_result_cache: OrderedDict[tuple, dict] = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+
+def _cached_result(key: tuple, compute) -> dict:
+    """Return the cached result for ``key``, computing and storing it on a miss."""
+    with _result_cache_lock:
+        hit = _result_cache.get(key)
+        if hit is not None:
+            _result_cache.move_to_end(key)
+            return hit
+    result = compute()
+    with _result_cache_lock:
+        _result_cache[key] = result
+        while len(_result_cache) > _RESULT_CACHE_MAX:
+            _result_cache.popitem(last=False)
+    return result
+
+
+def _text_digest(texts) -> str:
+    h = hashlib.blake2b(digest_size=8)
+    for text in texts:
+        h.update(text.encode("utf-8", "replace"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+def _build_sentiment_signal(symbol: str, asset_type: str,
+                            articles: list[dict] | None = None) -> Mapping:
     """Fetch news + social data and compute sentiment signal.
 
+    ``articles`` are news already fetched for the symbol (see the batch
+    pre-pass in _run_signal_scan); when None they are fetched here.
     Falls back to a neutral placeholder if APIs are unavailable or fail.
     """
     try:
@@ -27,23 +117,26 @@ def _build_sentiment_signal(symbol: str, asset_type: str) -> dict:
         from data.stocktwits_fetcher import fetch_stocktwits_posts
         from analysis.sentiment import compute_sentiment_signal
 
-        articles = fetch_news(symbol)
+        if articles is None:
+            articles = fetch_news(symbol)
         posts = fetch_reddit_posts(symbol, asset_type=asset_type)
         social_texts = [p["title"] for p in posts if p.get("title")]
+        reddit_count = len(social_texts)
 
         # Add StockTwits (real-time retail sentiment, no auth required)
         twits = fetch_stocktwits_posts(symbol)
         social_texts.extend(twits)
 
         if articles or social_texts:
-            result = compute_sentiment_signal(articles, social_texts)
+            titles = [a["title"] for a in articles if a.get("title")]
+            key = ("sentiment", symbol, _text_digest(titles + social_texts))
+            result = _cached_result(key, lambda: compute_sentiment_signal(articles, social_texts))
             logger.debug(
                 "Sentiment for %s: score=%.3f conf=%.3f "
                 "(news=%d reddit=%d twits=%d)",
                 symbol, result["score"], result["confidence"],
                 result.get("news_count", 0),
-                len([p for p in posts if p.get("title")]),
-                len(twits),
+                reddit_count, len(twits),
             )
             return result
     except Exception as e:
@@ -52,7 +145,7 @@ def _build_sentiment_signal(symbol: str, asset_type: str) -> dict:
     return _NEUTRAL_SIGNAL
 
 
-def _build_ml_signal(symbol: str, df) -> dict:
+def _build_ml_signal(symbol: str, df) -> Mapping:
     """Compute combined ML signal (XGBoost + LightGBM + LSTM).
 
     Loads saved models and only retrains when the model is stale.
@@ -61,7 +154,8 @@ def _build_ml_signal(symbol: str, df) -> dict:
     try:
         from analysis.ml_models import compute_ml_signal
 
-        result = compute_ml_signal(df, symbol, train_if_needed=True)
+        key = ("ml", symbol, df.index[-1], float(df["close"].iloc[-1]), len(df))
+        result = _cached_result(key, lambda: compute_ml_signal(df, symbol, train_if_needed=True))
         logger.debug(
             "ML signal for %s: score=%.3f conf=%.3f",
             symbol, result["score"], result["confidence"],
@@ -73,22 +167,80 @@ def _build_ml_signal(symbol: str, df) -> dict:
     return _NEUTRAL_SIGNAL
 
 
+def _load_price_history(symbol: str, asset_type: str):
+    """Return ~2 years of daily bars, fetching only the recent tail when possible.
+
+    A fresh price cache is used as-is. A stale one is topped up with the last
+    few days of bars, provided they overlap the cached history and the
+    overlapping completed bars are unchanged (a split or dividend re-adjusts
+    the whole history, which needs a full fetch). Anything else, including a
+    cache miss, falls back to the full two-year fetch.
+    """
+    import numpy as np
+    import pandas as pd
+    from data.stock_fetcher import fetch_stock_data
+    from data.crypto_fetcher import fetch_crypto_data
+    from data.cache_manager import get_cached_price_data
+
+    def fetch(full: bool):
+        if asset_type == "crypto":
+            return fetch_crypto_data(symbol, days=_HISTORY_DAYS if full else 5)
+        return fetch_stock_data(symbol, period="2y" if full else "5d")
+
+    try:
+        cached = get_cached_price_data(symbol, asset_type, days=_HISTORY_DAYS)
+        fresh = cached is not None
+        if not fresh:
+            cached = get_cached_price_data(symbol, asset_type, days=_HISTORY_DAYS,
+                                           allow_stale=True)
+    except Exception as e:
+        logger.debug("Price cache read failed for %s: %s", symbol, e)
+        cached, fresh = None, False
+
+    if cached is None or len(cached) < 2:
+        return fetch(full=True)
+    if cached.index[0] > pd.Timestamp.now() - pd.Timedelta(days=_HISTORY_MIN_SPAN):
+        return fetch(full=True)
+    if fresh:
+        return cached
+
+    recent = fetch(full=False)
+    if recent is None or recent.empty:
+        return recent
+    # The cache keys bars by calendar date
+    recent = recent.set_axis(recent.index.normalize())
+    # The last cached bar may have been still forming when it was stored
+    overlap = recent.index.intersection(cached.index[:-1])
+    if overlap.empty or not np.allclose(cached.loc[overlap, "close"],
+                                        recent.loc[overlap, "close"], rtol=1e-6):
+        logger.debug("Cached history for %s no longer lines up, refetching", symbol)
+        return fetch(full=True)
+    return pd.concat([cached[cached.index < recent.index[0]], recent])
+
+
 def _run_signal_scan():
     """Generate signals for all watchlist symbols."""
     from config import DEFAULT_STOCKS, DEFAULT_CRYPTO
     from db.models import get_setting
-    from data.stock_fetcher import fetch_stock_data
-    from data.crypto_fetcher import fetch_crypto_data
     from data.cache_manager import cache_price_data
     from analysis.technical import compute_technical_signal
     from strategy.signal_combiner import combine_signals
-    from db.models import save_signal
+    from db.models import save_signals_bulk
     from data.notifier import notify_signal, notify_daily_summary
+    # Per-symbol analysers, imported once per scan rather than per symbol
+    from analysis.multi_timeframe import compute_mtf_signal
+    from analysis.earnings_filter import get_earnings_filter
+    from analysis.analyst_consensus import get_analyst_consensus
+    from analysis.sector_rotation import get_sector_signal
+    from analysis.short_interest import get_short_interest_signal
+    from analysis.options_signal import get_options_signal
 
     stocks = get_setting("watchlist_stocks", DEFAULT_STOCKS)
     cryptos = get_setting("watchlist_crypto", DEFAULT_CRYPTO)
 
     all_signals = []
+    # Signal rows are persisted together at the end of the scan (one commit)
+    signal_rows = []
 
     # Run accuracy check on past signals (fills outcome_return_5d / outcome_correct)
     try:
@@ -107,8 +259,16 @@ def _run_signal_scan():
     from analysis.market_breadth import get_market_breadth
     from analysis.intermarket import get_intermarket_signal
     from analysis.fear_greed import get_fear_greed_signal
+    # The global fetches are independent API calls, so run them side by side
+    _check_scan_pool()
+    macro_fut     = _scan_submit(get_macro_signal)
+    breadth_fut   = _scan_submit(get_market_breadth)
+    inter_fut     = _scan_submit(get_intermarket_signal)
+    stock_fg_fut  = _scan_submit(get_fear_greed_signal, "stock")
+    crypto_fg_fut = _scan_submit(get_fear_greed_signal, "crypto")
+
     try:
-        macro_signal = get_macro_signal()
+        macro_signal = macro_fut.result(timeout=_GLOBAL_FETCH_TIMEOUT)
         logger.info("Macro signal: score=%.3f regime=%s conf=%.2f",
                     macro_signal["score"], macro_signal["regime"],
                     macro_signal["confidence"])
@@ -117,7 +277,7 @@ def _run_signal_scan():
         macro_signal = None
 
     try:
-        breadth_signal = get_market_breadth()
+        breadth_signal = breadth_fut.result(timeout=_GLOBAL_FETCH_TIMEOUT)
         logger.info("Market breadth: score=%.3f regime=%s above200=%.0f%%",
                     breadth_signal["score"], breadth_signal["regime"],
                     (breadth_signal.get("pct_above_200ma") or 0) * 100)
@@ -126,7 +286,7 @@ def _run_signal_scan():
         breadth_signal = None
 
     try:
-        intermarket_signal = get_intermarket_signal()
+        intermarket_signal = inter_fut.result(timeout=_GLOBAL_FETCH_TIMEOUT)
         logger.info("Intermarket: score=%.3f regime=%s",
                     intermarket_signal["score"], intermarket_signal["regime"])
     except Exception as exc:
@@ -134,8 +294,8 @@ def _run_signal_scan():
         intermarket_signal = None
 
     try:
-        stock_fg_signal  = get_fear_greed_signal("stock")
-        crypto_fg_signal = get_fear_greed_signal("crypto")
+        stock_fg_signal  = stock_fg_fut.result(timeout=_GLOBAL_FETCH_TIMEOUT)
+        crypto_fg_signal = crypto_fg_fut.result(timeout=_GLOBAL_FETCH_TIMEOUT)
         logger.info("Fear & Greed: stock=%s (%.0f) crypto=%s (%.0f)",
                     stock_fg_signal["fg_label"],  stock_fg_signal["fg_index"],
                     crypto_fg_signal["fg_label"], crypto_fg_signal["fg_index"])
@@ -143,20 +303,29 @@ def _run_signal_scan():
         logger.warning("Fear & Greed fetch failed, using None: %s", exc)
         stock_fg_signal = crypto_fg_signal = None
 
-    def _process_symbol(symbol: str, df, asset_type: str):
-        """Compute and persist a signal for one symbol (captures local imports)."""
-        from analysis.multi_timeframe import compute_mtf_signal
-        from analysis.earnings_filter import get_earnings_filter
-        from analysis.analyst_consensus import get_analyst_consensus
+    # News for the whole watchlist in one pre-pass (MarketAux requests cover
+    # several symbols each and re-fetch any symbol a batch missed).  The
+    # pre-pass returns an entry for every symbol, so only if it raises
+    # outright does each symbol fetch its own news on the scan workers.
+    try:
+        from data.news_fetcher import fetch_news_batch
+        news_by_symbol = fetch_news_batch(list(stocks) + list(cryptos))
+    except Exception as exc:
+        logger.warning("Batch news fetch failed, fetching per symbol: %s", exc)
+        news_by_symbol = {}
 
+    def _process_symbol(symbol: str, df, asset_type: str):
+        """Compute the signal for one symbol; returns (combined signal, DB row)."""
         cache_price_data(symbol, df, asset_type)
         tech_signal = compute_technical_signal(df)
-        sentiment_signal = _build_sentiment_signal(symbol, asset_type)
+        sentiment_signal = _build_sentiment_signal(symbol, asset_type,
+                                                   news_by_symbol.get(symbol))
         ml_signal = _build_ml_signal(symbol, df)
 
         # Multi-timeframe confluence (reuses daily df; fetches intraday for stocks)
         try:
-            mtf_signal = compute_mtf_signal(symbol, asset_type, df)
+            mtf_signal = compute_mtf_signal(symbol, asset_type, df,
+                                            daily_signal=tech_signal)
             logger.debug("MTF %s: score=%.3f alignment=%.2f TFs=%s",
                          symbol, mtf_signal["score"], mtf_signal["alignment"],
                          mtf_signal["timeframes_available"])
@@ -180,7 +349,6 @@ def _run_signal_scan():
 
         # Sector rotation (4-hour cached overview; per-symbol lookup)
         try:
-            from analysis.sector_rotation import get_sector_signal
             sector_signal = get_sector_signal(symbol, asset_type)
         except Exception as exc:
             logger.warning("Sector signal failed for %s: %s", symbol, exc)
@@ -188,7 +356,6 @@ def _run_signal_scan():
 
         # Short interest squeeze detector (24-hour cached; crypto returns neutral)
         try:
-            from analysis.short_interest import get_short_interest_signal
             short_interest_signal = get_short_interest_signal(symbol, asset_type, df)
         except Exception as exc:
             logger.warning("Short interest failed for %s: %s", symbol, exc)
@@ -196,7 +363,6 @@ def _run_signal_scan():
 
         # Options sentiment: put/call ratio + IV skew (2-hour cached; crypto N/A)
         try:
-            from analysis.options_signal import get_options_signal
             options_signal = get_options_signal(symbol, asset_type)
         except Exception as exc:
             logger.warning("Options signal failed for %s: %s", symbol, exc)
@@ -217,58 +383,83 @@ def _run_signal_scan():
             options=options_signal,
         )
         combined["symbol"] = symbol
-        save_signal(
-            symbol=symbol, signal_type="scheduled",
-            direction=combined["direction"], strength=combined["strength"],
-            confidence=combined["confidence"],
-            technical_score=combined["technical_score"],
-            sentiment_score=sentiment_signal["score"],
-            ml_score=ml_signal["score"],
-            macro_score=combined.get("macro_score"),
-            macro_regime=combined.get("macro_regime"),
-        )
-        if combined["direction"] in ("BUY", "SELL"):
-            notify_signal(symbol, combined)
-        all_signals.append(combined)
-
-        earnings_note = f" earnings:{combined['earnings_warning']}" if combined.get("earnings_warning") else ""
-        logger.info(
-            "Scheduled signal for %s: %s "
-            "(tech=%.2f sent=%.2f ml=%.2f macro=%.2f [%s] "
-            "mtf=%.2f breadth=%s analyst=%s sector=%s si=%s)%s",
-            symbol, combined["direction"],
+        row = (
+            symbol, "scheduled",
+            combined["direction"], combined["strength"],
+            combined["confidence"],
             combined["technical_score"],
             sentiment_signal["score"],
             ml_signal["score"],
-            combined.get("macro_score", 0.0),
-            combined.get("macro_regime", "N/A"),
-            combined.get("mtf_alignment", 0.5),
-            combined.get("breadth_regime", "N/A"),
-            combined.get("analyst_label", "N/A"),
-            combined.get("sector_regime", "N/A"),
-            combined.get("short_interest_regime", "N/A"),
-            earnings_note,
+            combined["macro_score"],
+            combined["macro_regime"],
         )
+        if combined["direction"] in ("BUY", "SELL"):
+            notify_signal(symbol, combined)
 
-    # Stocks
-    for sym in stocks:
-        try:
-            df = fetch_stock_data(sym, period="2y")
-            if df is None or df.empty:
+        # The summary line takes a dozen lookups plus an f-string; skip them
+        # entirely when INFO is filtered out
+        if logger.isEnabledFor(logging.INFO):
+            warning = combined["earnings_warning"]
+            earnings_note = f" earnings:{warning}" if warning else ""
+            logger.info(
+                "Scheduled signal for %s: %s "
+                "(tech=%.2f sent=%.2f ml=%.2f macro=%.2f [%s] "
+                "mtf=%.2f breadth=%s analyst=%s sector=%s si=%s)%s",
+                symbol, combined["direction"],
+                combined["technical_score"],
+                sentiment_signal["score"],
+                ml_signal["score"],
+                combined["macro_score"],
+                combined["macro_regime"],
+                combined["mtf_alignment"],
+                combined["breadth_regime"],
+                combined["analyst_label"],
+                combined["sector_regime"],
+                combined["short_interest_regime"],
+                earnings_note,
+            )
+        return combined, row
+
+    def _fetch_and_process(symbol: str, asset_type: str):
+        df = _load_price_history(symbol, asset_type)
+        if df is None or df.empty:
+            return None
+        return _process_symbol(symbol, df, asset_type)
+
+    # Per-symbol work is I/O-bound (price, news, social, analyst fetches), so
+    # symbols run concurrently; results are collected on this thread. Stocks
+    # and crypto pairs are submitted alternately so the yfinance and exchange
+    # rate limits are both in use from the start, rather than every crypto
+    # pair queueing behind the whole stock list.
+    stock_tasks = [(sym, "stock") for sym in stocks]
+    crypto_tasks = [(pair, "crypto") for pair in cryptos]
+    tasks = [task for both in zip_longest(stock_tasks, crypto_tasks)
+             for task in both if task is not None]
+    futures = {_scan_submit(_fetch_and_process, sym, at): sym for sym, at in tasks}
+    try:
+        for fut in as_completed(futures, timeout=_SCAN_TIMEOUT):
+            try:
+                result = fut.result()
+            except Exception as e:
+                logger.warning("Scheduled scan failed for %s: %s", futures[fut], e)
                 continue
-            _process_symbol(sym, df, "stock")
-        except Exception as e:
-            logger.warning("Scheduled scan failed for %s: %s", sym, e)
+            if result is not None:
+                combined, row = result
+                all_signals.append(combined)
+                signal_rows.append(row)
+    except FuturesTimeout:
+        pending = [sym for fut, sym in futures.items() if not fut.done()]
+        logger.warning("Scheduled scan timed out; skipping %d symbols: %s",
+                       len(pending), ", ".join(pending))
+        # Drop queued symbols so they don't hold up the next scan; running
+        # ones finish in the background and their results are discarded
+        for fut in futures:
+            fut.cancel()
 
-    # Crypto
-    for pair in cryptos:
-        try:
-            df = fetch_crypto_data(pair, days=730)
-            if df is None or df.empty:
-                continue
-            _process_symbol(pair, df, "crypto")
-        except Exception as e:
-            logger.warning("Scheduled scan failed for %s: %s", pair, e)
+    try:
+        save_signals_bulk(signal_rows)
+    except Exception as e:
+        logger.warning("Saving %d scheduled signals failed: %s", len(signal_rows), e)
 
     # Daily summary
     notify_daily_summary(all_signals)
@@ -276,10 +467,9 @@ def _run_signal_scan():
     return all_signals
 
 
-def _scheduler_loop(interval_minutes: int):
+def _scheduler_loop(interval_minutes: int, stop_event: threading.Event):
     """Background loop that runs scans at the configured interval."""
-    global _running
-    while _running:
+    while not stop_event.is_set():
         try:
             now = datetime.now()
             logger.info("Scheduler: starting scan at %s", now.strftime("%H:%M"))
@@ -288,39 +478,40 @@ def _scheduler_loop(interval_minutes: int):
             logger.error("Scheduler error: %s", e)
 
         # Block until the interval elapses or stop_scheduler() sets the event
-        _stop_event.wait(timeout=interval_minutes * 60)
-        _stop_event.clear()
+        stop_event.wait(timeout=interval_minutes * 60)
 
 
 def start_scheduler(interval_minutes: int = 60):
     """Start the background scheduler thread."""
-    global _scheduler_thread, _running
-    if _running:
-        logger.info("Scheduler already running")
-        return
-
-    _running = True
-    _stop_event.clear()
-    _scheduler_thread = threading.Thread(
-        target=_scheduler_loop,
-        args=(interval_minutes,),
-        daemon=True,
-        name="ai_invest_scheduler",
-    )
-    _scheduler_thread.start()
+    global _scheduler_thread, _stop_event
+    with _scheduler_lock:
+        if is_running():
+            logger.info("Scheduler already running")
+            return
+
+        # Each run gets its own one-shot stop event, so a loop that was
+        # stopped mid-scan still exits even if the scheduler is restarted
+        _stop_event = threading.Event()
+        _scheduler_thread = threading.Thread(
+            target=_scheduler_loop,
+            args=(interval_minutes, _stop_event),
+            daemon=True,
+            name="ai_invest_scheduler",
+        )
+        _scheduler_thread.start()
     logger.info("Scheduler started (interval: %d min)", interval_minutes)
 
 
 def stop_scheduler():
     """Stop the background scheduler."""
-    global _running
-    _running = False
-    _stop_event.set()  # Wake the sleeping loop immediately
+    with _scheduler_lock:
+        _stop_event.set()  # Wake the sleeping loop immediately
     logger.info("Scheduler stopped")
 
 
 def is_running() -> bool:
-    return _running
+    return (_scheduler_thread is not None and _scheduler_thread.is_alive()
+            and not _stop_event.is_set())
 
 
 def run_scan_now() -> list[dict]:
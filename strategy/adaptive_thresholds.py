@@ -19,9 +19,40 @@ Example regime adjustments (cumulative, then clamped):
     VIX < 12 + RISK_ON macro + HEALTHY breadth → buy_thresh down to 0.20
 """
 
-import numpy as np
+from bisect import bisect_left
+
 from config import BUY_THRESHOLD, BUY_CONFIDENCE_MIN, SELL_THRESHOLD, SELL_CONFIDENCE_MIN
 
+# VIX bands: < 12 very calm, 12–20 normal, then (20, 30], (30, 40], > 40.
+# _VIX_EDGES are the right-closed upper edges above the normal band.
+_VIX_EDGES = (20, 30, 40)
+_VIX_DELTAS = (
+    # (buy_thresh delta, buy_conf delta, label)
+    (-0.05, -0.03, "very calm"),
+    (0.0,   0.0,   None),
+    (0.05,  0.03,  "elevated"),
+    (0.10,  0.07,  "high"),
+    (0.15,  0.10,  "extreme"),
+)
+
+_MACRO_DELTAS = {
+    "RISK_OFF":     (0.08,  0.05),
+    "CAUTIOUS":     (0.04,  0.02),
+    "RISK_ON":      (-0.03, 0.0),
+    "CONSTRUCTIVE": (-0.01, 0.0),
+}
+
+_BREADTH_DELTAS = {
+    "POOR":    (0.06,  0.04),
+    "WEAK":    (0.03,  0.02),
+    "HEALTHY": (-0.02, 0.0),
+}
+
+
+def _describe(prefix: str, d_thresh: float, d_conf: float) -> str:
+    text = f"{prefix} {d_thresh:+.2f} thresh"
+    return f"{text} / {d_conf:+.2f} conf" if d_conf else text
+
 
 def get_adaptive_thresholds(
     vix_level: float | None = None,
@@ -52,61 +83,32 @@ def get_adaptive_thresholds(
 
     # ── VIX adjustments ──────────────────────────────────────────────────
     if vix_level is not None and vix_level > 0:
-        if vix_level > 40:
-            # Extreme fear — very high bar for BUY
-            buy_thresh += 0.15
-            buy_conf   += 0.10
-            adjustments.append(f"VIX {vix_level:.0f} (extreme) +0.15 thresh / +0.10 conf")
-        elif vix_level > 30:
-            # High fear — elevated bar
-            buy_thresh += 0.10
-            buy_conf   += 0.07
-            adjustments.append(f"VIX {vix_level:.0f} (high) +0.10 thresh / +0.07 conf")
-        elif vix_level > 20:
-            # Moderate fear — slightly elevated
-            buy_thresh += 0.05
-            buy_conf   += 0.03
-            adjustments.append(f"VIX {vix_level:.0f} (elevated) +0.05 thresh / +0.03 conf")
-        elif vix_level < 12:
-            # Very calm — slightly more aggressive
-            buy_thresh -= 0.05
-            buy_conf   -= 0.03
-            adjustments.append(f"VIX {vix_level:.0f} (very calm) -0.05 thresh / -0.03 conf")
+        band = 1 + bisect_left(_VIX_EDGES, vix_level) if vix_level >= 12 else 0
+        d_thresh, d_conf, label = _VIX_DELTAS[band]
+        if label is not None:
+            buy_thresh += d_thresh
+            buy_conf   += d_conf
+            adjustments.append(_describe(f"VIX {vix_level:.0f} ({label})", d_thresh, d_conf))
 
     # ── Macro regime adjustments ─────────────────────────────────────────
-    if macro_regime == "RISK_OFF":
-        buy_thresh += 0.08
-        buy_conf   += 0.05
-        adjustments.append("macro RISK_OFF +0.08 thresh / +0.05 conf")
-    elif macro_regime == "CAUTIOUS":
-        buy_thresh += 0.04
-        buy_conf   += 0.02
-        adjustments.append("macro CAUTIOUS +0.04 thresh / +0.02 conf")
-    elif macro_regime == "RISK_ON":
-        buy_thresh -= 0.03
-        adjustments.append("macro RISK_ON -0.03 thresh")
-    elif macro_regime == "CONSTRUCTIVE":
-        buy_thresh -= 0.01
-        adjustments.append("macro CONSTRUCTIVE -0.01 thresh")
+    deltas = _MACRO_DELTAS.get(macro_regime)
+    if deltas is not None:
+        buy_thresh += deltas[0]
+        buy_conf   += deltas[1]
+        adjustments.append(_describe(f"macro {macro_regime}", *deltas))
 
     # ── Market breadth adjustments ───────────────────────────────────────
-    if breadth_regime == "POOR":
-        buy_thresh += 0.06
-        buy_conf   += 0.04
-        adjustments.append("breadth POOR +0.06 thresh / +0.04 conf")
-    elif breadth_regime == "WEAK":
-        buy_thresh += 0.03
-        buy_conf   += 0.02
-        adjustments.append("breadth WEAK +0.03 thresh / +0.02 conf")
-    elif breadth_regime == "HEALTHY":
-        buy_thresh -= 0.02
-        adjustments.append("breadth HEALTHY -0.02 thresh")
+    deltas = _BREADTH_DELTAS.get(breadth_regime)
+    if deltas is not None:
+        buy_thresh += deltas[0]
+        buy_conf   += deltas[1]
+        adjustments.append(_describe(f"breadth {breadth_regime}", *deltas))
 
     # ── Clamp to safe ranges ─────────────────────────────────────────────
-    buy_thresh  = float(np.clip(buy_thresh,   0.15, 0.55))
-    buy_conf    = float(np.clip(buy_conf,     0.50, 0.85))
-    sell_thresh = float(np.clip(sell_thresh, -0.50, -0.10))
-    sell_conf   = float(np.clip(sell_conf,   0.40, 0.75))
+    buy_thresh  = min(max(buy_thresh,   0.15), 0.55)
+    buy_conf    = min(max(buy_conf,     0.50), 0.85)
+    sell_thresh = min(max(sell_thresh, -0.50), -0.10)
+    sell_conf   = min(max(sell_conf,    0.40), 0.75)
 
     return {
         "buy_threshold":  round(buy_thresh,  4),
@@ -1,27 +1,65 @@
 """Event-driven backtesting engine."""
 
 import logging
+import threading
+from collections import OrderedDict
+from functools import reduce
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from analysis.technical import compute_technical_signal
+from analysis.technical import (atr as calc_atr, compute_all_indicators,
+                                compute_technical_signal)
 from config import (BUY_THRESHOLD, SELL_THRESHOLD, BUY_CONFIDENCE_MIN,
                     SELL_CONFIDENCE_MIN, STOP_LOSS, RISK)
 
 logger = logging.getLogger(__name__)
 
-
-def make_ai_signal_func(symbol: str):
+# Optional: Numba fuses the equity-curve statistics in _compute_metrics into
+# a single pass; without it they are separate NumPy reductions.
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# AI-mode signals keyed by (symbol, last bar, bar count, last close).  Each
+# bar's signal only depends on the history up to it, so walk-forward folds
+# and repeat runs over the same data reuse earlier results.
+_SIGNAL_CACHE_MAX = 20000
+_signal_cache: OrderedDict[tuple, dict] = OrderedDict()
+_signal_cache_lock = threading.Lock()
+
+# Bars handed to the technical indicators.  The longest lookback is the
+# 200-bar SMA; the EMAs have converged to well below display precision by
+# then, so the tail gives the same score as the full history.
+_TECH_HISTORY_WINDOW = 300
+
+# Bars a symbol needs before the backtest will trade it.
+_MIN_HISTORY = 200
+
+# Trade log rows: ``symbol`` is the symbol's column, ``action`` indexes
+# _TRADE_ACTIONS and ``row`` is the trade date's row in the calendar.
+_TRADE_ACTIONS = ("BUY", "SELL (STOP)", "SELL (SIGNAL)", "CLOSE")
+_BUY, _SELL_STOP, _SELL_SIGNAL, _CLOSE = range(len(_TRADE_ACTIONS))
+_TRADE_DTYPE = np.dtype([
+    ("symbol", np.int32), ("action", np.uint8), ("row", np.int64),
+    ("price", np.float64), ("quantity", np.float64), ("pnl", np.float64),
+])
+
+
+def make_ai_signal_func(symbol: str, history_window: int = _TECH_HISTORY_WINDOW):
     """Return a signal function that combines technical + ML signals.
 
     Used for AI-mode backtesting.  The ML model is loaded from disk
     (trained before the backtest period starts) to avoid look-ahead bias.
+    Only the last ``history_window`` bars feed the technical indicators;
+    the ML models still see the full history they train on.
     """
     from analysis.ml_models import compute_ml_signal
     from strategy.signal_combiner import combine_signals
 
-    def _signal(df: pd.DataFrame) -> dict:
-        tech = compute_technical_signal(df)
+    def _compute(df: pd.DataFrame) -> dict:
+        tech = compute_technical_signal(df.iloc[-history_window:] if history_window else df)
         try:
             ml = compute_ml_signal(df, symbol, train_if_needed=True)
         except Exception:
@@ -30,6 +68,22 @@ def make_ai_signal_func(symbol: str):
         neutral = {"score": 0.0, "confidence": 0.3}
         return combine_signals(tech, neutral, ml)
 
+    def _signal(df: pd.DataFrame) -> dict:
+        if df.empty:
+            return _compute(df)
+        key = (symbol, history_window, df.index[-1], len(df), float(df["close"].iloc[-1]))
+        with _signal_cache_lock:
+            hit = _signal_cache.get(key)
+            if hit is not None:
+                _signal_cache.move_to_end(key)
+                return hit
+        result = _compute(df)
+        with _signal_cache_lock:
+            _signal_cache[key] = result
+            while len(_signal_cache) > _SIGNAL_CACHE_MAX:
+                _signal_cache.popitem(last=False)
+        return result
+
     return _signal
 
 
@@ -56,6 +110,7 @@ class BacktestEngine:
             dict with performance metrics and equity curve.
         """
         # Build per-symbol signal functions for AI mode
+        precompute = mode != "ai" and signal_func is None
         if mode == "ai":
             symbol_signal_funcs = {
                 sym: make_ai_signal_func(sym) for sym in price_data
@@ -65,92 +120,109 @@ class BacktestEngine:
             _base_func = signal_func if signal_func is not None else compute_technical_signal
             symbol_signal_funcs = {sym: _base_func for sym in price_data}
 
-        from analysis.technical import atr as calc_atr
-
         cash = self.initial_capital
-        positions = {}  # symbol → {'quantity', 'entry_price', 'stop_loss'}
-        trades = []
+        trade_rows = []  # _TRADE_DTYPE tuples
         equity_curve = []
-        dates = []
         running_peak = self.initial_capital  # maintained incrementally — O(1) per step
 
         # Align all data to common dates
-        all_dates = set()
+        all_dates = pd.DatetimeIndex(reduce(
+            np.union1d, (df.index.values for df in price_data.values()),
+            np.array([], dtype="datetime64[ns]"),
+        ))
+
+        # Dense (date, symbol) views of the data, built once so the loop
+        # reads closes and bar positions by integer index instead of pandas
+        # label lookups: close_mat holds each symbol's close on each date,
+        # atr_mat its ATR (for entry stops) and bar_mat the bar's position
+        # in that symbol's frame (-1 = no bar).
+        symbols = list(price_data)
+        col = {sym: j for j, sym in enumerate(symbols)}
+        close_mat = np.full((len(all_dates), len(symbols)), np.nan)
+        atr_mat = np.full_like(close_mat, np.nan)
+        bar_mat = np.full((len(all_dates), len(symbols)), -1, dtype=np.int64)
         for sym, df in price_data.items():
-            all_dates.update(df.index.tolist())
-        all_dates = sorted(all_dates)
-
-        for date in all_dates:
-            # Update portfolio value
-            port_value = cash
-            for sym, pos in positions.items():
-                if sym in price_data and date in price_data[sym].index:
-                    port_value += pos["quantity"] * price_data[sym].loc[date, "close"]
-                else:
-                    port_value += pos["quantity"] * pos["entry_price"]
+            rows = all_dates.get_indexer(df.index)
+            close_mat[rows, col[sym]] = df["close"].to_numpy(dtype=float)
+            atr_mat[rows, col[sym]] = calc_atr(df).to_numpy(dtype=float)
+            bar_mat[rows, col[sym]] = np.arange(len(df))
+        if precompute:
+            score_mat, conf_mat = self._precompute_signals(price_data, all_dates)
+
+        # Open positions, one slot per symbol column.  opened_seq records
+        # the order positions were opened so trades for several symbols on
+        # the same date are emitted oldest position first.
+        n_sym = len(symbols)
+        held = np.zeros(n_sym, dtype=bool)
+        qty = np.zeros(n_sym)
+        entry_price = np.zeros(n_sym)
+        stop_loss = np.zeros(n_sym)
+        trailing_stop = np.zeros(n_sym)
+        highest = np.zeros(n_sym)
+        opened_seq = np.zeros(n_sym, dtype=np.int64)
+        next_seq = 0
+
+        def _in_open_order(mask):
+            idx = np.flatnonzero(mask)
+            return idx[np.argsort(opened_seq[idx], kind="stable")]
+
+        for row, date in enumerate(all_dates):
+            closes = close_mat[row]
+            bars = bar_mat[row]
+            live = held & (bars >= 0)
+
+            # Update portfolio value (entry price for symbols with no bar today)
+            mark = np.where(live, closes, entry_price)
+            port_value = cash + float(qty[held] @ mark[held])
 
             running_peak = max(running_peak, port_value)
             equity_curve.append(port_value)
-            dates.append(date)
-
-            # Check stop losses
-            closed_syms = []
-            for sym, pos in positions.items():
-                if sym in price_data and date in price_data[sym].index:
-                    current_price = price_data[sym].loc[date, "close"]
-
-                    # Trailing stop update
-                    if current_price > pos.get("highest", pos["entry_price"]):
-                        pos["highest"] = current_price
-                        pos["trailing_stop"] = current_price * (1 - STOP_LOSS["trailing"])
-
-                    # Check stops
-                    stop = max(pos.get("stop_loss", 0), pos.get("trailing_stop", 0))
-                    if current_price <= stop:
-                        # Stop loss triggered
-                        proceeds = pos["quantity"] * current_price * (1 - self.commission)
-                        cash += proceeds
-                        pnl = (current_price - pos["entry_price"]) * pos["quantity"]
-                        trades.append({
-                            "symbol": sym, "action": "SELL (STOP)",
-                            "date": str(date)[:10], "price": current_price,
-                            "quantity": pos["quantity"], "pnl": round(pnl, 2),
-                        })
-                        closed_syms.append(sym)
-
-            for sym in closed_syms:
-                del positions[sym]
+
+            # Trailing stop update
+            rising = live & (closes > highest)
+            highest[rising] = closes[rising]
+            trailing_stop[rising] = closes[rising] * (1 - STOP_LOSS["trailing"])
+
+            # Check stops
+            for j in _in_open_order(live & (closes <= np.maximum(stop_loss, trailing_stop))):
+                current_price = closes[j]
+                proceeds = qty[j] * current_price * (1 - self.commission)
+                cash += proceeds
+                pnl = (current_price - entry_price[j]) * qty[j]
+                trade_rows.append((j, _SELL_STOP, row, current_price,
+                                   qty[j], round(float(pnl), 2)))
+                held[j] = False
 
             # Check drawdown protection
             current_dd = (running_peak - port_value) / running_peak if running_peak > 0 else 0
             if current_dd >= RISK["drawdown_halt"]:
                 continue  # Skip new signals
 
-            # Generate signals for each symbol
-            for sym, df in price_data.items():
-                if date not in df.index:
-                    continue
+            # Generate signals for each symbol with a bar today and enough
+            # history before it (no bar is -1, so one test covers both)
+            for j in np.flatnonzero(bars >= _MIN_HISTORY):
+                sym = symbols[j]
 
-                date_idx = df.index.get_loc(date)
-                if date_idx < 200:  # Need enough history
-                    continue
-
-                history = df.iloc[:date_idx + 1]
-
-                try:
-                    sig_fn = symbol_signal_funcs.get(sym, compute_technical_signal)
-                    signal = sig_fn(history)
-                except Exception:
-                    logger.warning("Signal computation failed for %s on %s", sym, str(date)[:10])
-                    continue
+                if precompute:
+                    score = score_mat[row, j]
+                    confidence = conf_mat[row, j]
+                    if np.isnan(score):
+                        continue
+                else:
+                    try:
+                        sig_fn = symbol_signal_funcs.get(sym, compute_technical_signal)
+                        signal = sig_fn(price_data[sym].iloc[:bars[j] + 1])
+                    except Exception:
+                        logger.warning("Signal computation failed for %s on %s", sym, str(date)[:10])
+                        continue
 
-                score = signal.get("score", 0)
-                confidence = signal.get("confidence", 0)
+                    score = signal.get("score", 0)
+                    confidence = signal.get("confidence", 0)
 
                 # BUY signal
-                if (sym not in positions and score > BUY_THRESHOLD
+                if (not held[j] and score > BUY_THRESHOLD
                         and confidence >= BUY_CONFIDENCE_MIN):
-                    price = df.loc[date, "close"]
+                    price = closes[j]
                     position_value = port_value * self.position_size_pct
                     quantity = position_value / price
                     cost = quantity * price * (1 + self.commission)
@@ -158,58 +230,49 @@ class BacktestEngine:
                     if cost <= cash:
                         cash -= cost
                         # ATR-based stop loss
-                        atr_val = calc_atr(history).iloc[-1]
-                        stop = price - STOP_LOSS["atr_multiplier"] * atr_val if not pd.isna(atr_val) else price * 0.95
-
-                        positions[sym] = {
-                            "quantity": quantity,
-                            "entry_price": price,
-                            "stop_loss": stop,
-                            "trailing_stop": price * (1 - STOP_LOSS["trailing"]),
-                            "highest": price,
-                        }
-                        trades.append({
-                            "symbol": sym, "action": "BUY",
-                            "date": str(date)[:10], "price": price,
-                            "quantity": round(quantity, 4), "pnl": 0,
-                        })
+                        atr_val = atr_mat[row, j]
+                        stop = price - STOP_LOSS["atr_multiplier"] * atr_val if not np.isnan(atr_val) else price * 0.95
+
+                        held[j] = True
+                        qty[j] = quantity
+                        entry_price[j] = price
+                        stop_loss[j] = stop
+                        trailing_stop[j] = price * (1 - STOP_LOSS["trailing"])
+                        highest[j] = price
+                        opened_seq[j] = next_seq
+                        next_seq += 1
+                        trade_rows.append((j, _BUY, row, price,
+                                           round(float(quantity), 4), 0.0))
 
                 # SELL signal
-                elif (sym in positions and score < SELL_THRESHOLD
+                elif (held[j] and score < SELL_THRESHOLD
                       and confidence >= SELL_CONFIDENCE_MIN):
-                    price = df.loc[date, "close"]
-                    pos = positions[sym]
-                    proceeds = pos["quantity"] * price * (1 - self.commission)
+                    price = closes[j]
+                    proceeds = qty[j] * price * (1 - self.commission)
                     cash += proceeds
-                    pnl = (price - pos["entry_price"]) * pos["quantity"]
-                    trades.append({
-                        "symbol": sym, "action": "SELL (SIGNAL)",
-                        "date": str(date)[:10], "price": price,
-                        "quantity": pos["quantity"], "pnl": round(pnl, 2),
-                    })
-                    del positions[sym]
+                    pnl = (price - entry_price[j]) * qty[j]
+                    trade_rows.append((j, _SELL_SIGNAL, row, price,
+                                       qty[j], round(float(pnl), 2)))
+                    held[j] = False
 
         # Close remaining positions at last price
-        for sym, pos in positions.items():
-            if sym in price_data and len(price_data[sym]) > 0:
-                last_price = price_data[sym]["close"].iloc[-1]
-                cash += pos["quantity"] * last_price * (1 - self.commission)
-                pnl = (last_price - pos["entry_price"]) * pos["quantity"]
-                trades.append({
-                    "symbol": sym, "action": "CLOSE",
-                    "date": str(all_dates[-1])[:10] if all_dates else "",
-                    "price": last_price, "quantity": pos["quantity"],
-                    "pnl": round(pnl, 2),
-                })
+        for j in _in_open_order(held):
+            last_price = price_data[symbols[j]]["close"].iloc[-1]
+            cash += qty[j] * last_price * (1 - self.commission)
+            pnl = (last_price - entry_price[j]) * qty[j]
+            trade_rows.append((j, _CLOSE, len(all_dates) - 1, last_price,
+                               qty[j], round(float(pnl), 2)))
 
         # Compute metrics
-        metrics = self._compute_metrics(equity_curve, trades)
+        trade_log = np.array(trade_rows, dtype=_TRADE_DTYPE)
+        metrics = self._compute_metrics(equity_curve, trade_log)
         metrics["equity_curve"] = equity_curve
-        metrics["dates"] = [str(d)[:10] for d in dates]
-        metrics["trades"] = trades
+        date_strs = all_dates.strftime("%Y-%m-%d").tolist()
+        metrics["dates"] = date_strs
+        metrics["trades"] = _trade_records(trade_log, symbols, date_strs)
 
         # Buy & Hold benchmark
-        benchmark = self._compute_benchmark(price_data, all_dates)
+        benchmark = self._compute_benchmark(close_mat)
         metrics["benchmark"] = benchmark
 
         # Information ratio vs benchmark
@@ -219,7 +282,7 @@ class BacktestEngine:
 
         return metrics
 
-    def _compute_metrics(self, equity_curve: list, trades: list) -> dict:
+    def _compute_metrics(self, equity_curve: list, trades: np.ndarray) -> dict:
         if not equity_curve or len(equity_curve) < 2:
             return {"error": "Insufficient data"}
 
@@ -232,41 +295,35 @@ class BacktestEngine:
         years = n_days / 252
         annual_return = (1 + total_return) ** (1 / max(years, 0.01)) - 1 if total_return > -1 else -1
 
-        # Daily returns
-        eq = np.array(equity_curve)
-        daily_returns = np.diff(eq) / eq[:-1]
+        # Daily returns, their mean / std, max drawdown and downside std
+        eq = np.array(equity_curve, dtype=float)
+        return_stats = _return_stats_kernel if _HAS_NUMBA else _return_stats_numpy
+        daily_returns, mean_ret, std_ret, max_dd, downside_std = return_stats(eq)
 
         # Sharpe ratio (annualized, rf=4%)
-        if len(daily_returns) > 0 and np.std(daily_returns) > 0:
-            sharpe = (np.mean(daily_returns) - 0.04 / 252) / np.std(daily_returns) * np.sqrt(252)
+        if len(daily_returns) > 0 and std_ret > 0:
+            sharpe = (mean_ret - 0.04 / 252) / std_ret * np.sqrt(252)
         else:
             sharpe = 0
 
-        # Max drawdown
-        peak = np.maximum.accumulate(eq)
-        drawdown = (peak - eq) / peak
-        max_dd = float(np.max(drawdown))
-
         # Win rate
-        pnl_values = [t["pnl"] for t in trades if t["action"] != "BUY"]
-        wins = sum(1 for p in pnl_values if p > 0)
+        pnl_values = trades["pnl"][trades["action"] != _BUY]
+        wins = int(np.count_nonzero(pnl_values > 0))
         total_closed = len(pnl_values)
         win_rate = wins / total_closed if total_closed > 0 else 0
 
         # Profit factor
-        gross_profit = sum(p for p in pnl_values if p > 0)
-        gross_loss = abs(sum(p for p in pnl_values if p < 0))
+        gross_profit = float(pnl_values[pnl_values > 0].sum())
+        gross_loss = abs(float(pnl_values[pnl_values < 0].sum()))
         profit_factor = gross_profit / gross_loss if gross_loss > 0 else float("inf")
 
         # ── Sortino ratio (downside deviation) ───────────────────────
         if len(daily_returns) > 0:
-            downside = daily_returns[daily_returns < 0]
-            downside_std = float(np.std(downside)) if len(downside) > 0 else 0.0
             if downside_std > 1e-12:
                 sortino = float(
-                    (np.mean(daily_returns) - 0.04 / 252) / downside_std * np.sqrt(252)
+                    (mean_ret - 0.04 / 252) / downside_std * np.sqrt(252)
                 )
-            elif np.std(daily_returns) > 1e-12:
+            elif std_ret > 1e-12:
                 sortino = float(sharpe)  # No downside: mirror Sharpe
             else:
                 sortino = 0.0
@@ -278,9 +335,7 @@ class BacktestEngine:
 
         # ── VaR and CVaR at 95 % confidence (daily returns) ──────────
         if len(daily_returns) > 0:
-            var_95 = float(np.percentile(daily_returns, 5))
-            tail = daily_returns[daily_returns <= var_95]
-            cvar_95 = float(np.mean(tail)) if len(tail) > 0 else var_95
+            var_95, cvar_95 = _var_cvar(daily_returns, 5)
         else:
             var_95 = 0.0
             cvar_95 = 0.0
@@ -319,30 +374,145 @@ class BacktestEngine:
             return 0.0
         return round(float(np.mean(excess) / te * np.sqrt(252)), 4)
 
-    def _compute_benchmark(self, price_data: dict, dates: list) -> list:
-        """Equal-weight buy & hold benchmark."""
-        if not price_data or not dates:
+    def _precompute_signals(self, price_data: dict[str, pd.DataFrame],
+                            all_dates: pd.DatetimeIndex) -> tuple[np.ndarray, np.ndarray]:
+        """Technical score and confidence for every tradable bar.
+
+        Returns two (date, symbol) matrices, NaN where there is no signal.
+        The indicators are causal, so computing them once over each full
+        series gives every bar the values its own history prefix would;
+        only the per-bar scoring still runs bar by bar.
+        """
+        score_mat = np.full((len(all_dates), len(price_data)), np.nan)
+        conf_mat = np.full_like(score_mat, np.nan)
+        for j, (sym, df) in enumerate(price_data.items()):
+            if len(df) <= _MIN_HISTORY:
+                continue
+            rows = all_dates.get_indexer(df.index)
+            try:
+                indicators = compute_all_indicators(df)
+            except Exception:
+                logger.warning("Indicator computation failed for %s", sym)
+                continue
+            for i in range(_MIN_HISTORY, len(df)):
+                try:
+                    signal = compute_technical_signal(df.iloc[:i + 1],
+                                                      _indicators=indicators.iloc[:i + 1])
+                except Exception:
+                    logger.warning("Signal computation failed for %s on %s",
+                                   sym, str(df.index[i])[:10])
+                    continue
+                score_mat[rows[i], j] = signal.get("score", 0)
+                conf_mat[rows[i], j] = signal.get("confidence", 0)
+        return score_mat, conf_mat
+
+    def _compute_benchmark(self, close_mat: np.ndarray) -> list:
+        """Equal-weight buy & hold benchmark.
+
+        Each symbol gets an equal slice of the initial capital, held as cash
+        until its first bar and bought at that close; on dates where it has
+        no bar its last close carries forward.
+        """
+        n_dates, n_assets = close_mat.shape
+        if not n_dates or not n_assets:
             return []
 
-        n_assets = len(price_data)
         alloc = self.initial_capital / n_assets
-        shares = {}
+        has_bar = ~np.isnan(close_mat)
+        first_price = close_mat[has_bar.argmax(axis=0), np.arange(n_assets)]
+        buyable = has_bar.any(axis=0) & (first_price > 0)
+        shares = np.where(buyable, alloc / np.where(buyable, first_price, 1.0), 0.0)
+
+        # Before its first bar a symbol is valued at its entry price (i.e.
+        # the cash set aside for it); symbols that can't be bought stay cash
+        held = pd.DataFrame(close_mat).ffill().to_numpy()
+        held = np.where(np.isnan(held), first_price, held)
+        held[:, ~buyable] = 0.0
+        benchmark = held @ shares + alloc * np.count_nonzero(~buyable)
+        return np.where(benchmark > 0, benchmark, self.initial_capital).tolist()
+
+
+# ── Internal helpers ──────────────────────────────────────────────────
+
+def _trade_records(trade_log: np.ndarray, symbols: list,
+                   date_strs: list) -> list[dict]:
+    """Expand the trade log into the list of trade dicts ``run`` returns."""
+    return [
+        {
+            "symbol": symbols[j], "action": _TRADE_ACTIONS[action],
+            "date": date_strs[row], "price": price,
+            "quantity": quantity, "pnl": 0 if action == _BUY else pnl,
+        }
+        for j, action, row, price, quantity, pnl in trade_log.tolist()
+    ]
 
-        for sym, df in price_data.items():
-            first_valid = df.index[0]
-            close_price = df.loc[first_valid, "close"]
-            if close_price == 0:
-                continue
-            shares[sym] = alloc / close_price
-
-        benchmark = []
-        for date in dates:
-            val = 0
-            for sym, df in price_data.items():
-                if date in df.index:
-                    val += shares[sym] * df.loc[date, "close"]
-                elif benchmark:
-                    val += benchmark[-1] / n_assets  # Carry forward
-            benchmark.append(val if val > 0 else self.initial_capital)
-
-        return benchmark
+
+def _return_stats_numpy(eq: np.ndarray) -> tuple:
+    """Daily returns of ``eq`` with their mean and std, the max drawdown of
+    ``eq``, and the std of the negative returns (0 when there are none)."""
+    daily_returns = np.diff(eq) / eq[:-1]
+    peak = np.maximum.accumulate(eq)
+    max_dd = float(np.max((peak - eq) / peak))
+    downside = daily_returns[daily_returns < 0]
+    downside_std = float(np.std(downside)) if len(downside) > 0 else 0.0
+    return (daily_returns, float(np.mean(daily_returns)), float(np.std(daily_returns)),
+            max_dd, downside_std)
+
+
+def _var_cvar(returns: np.ndarray, q: float) -> tuple[float, float]:
+    """Historical VaR (the ``q``-th percentile, interpolated exactly as
+    np.percentile does) and CVaR (mean of the returns at or below it).
+
+    One partition places the two order statistics the percentile
+    interpolates between; everything left of them is the CVaR tail, so no
+    mask over the whole array is needed.
+    """
+    n = len(returns)
+    h = (n - 1) * (q / 100)
+    k = int(h)
+    t = h - k
+    hi = min(k + 1, n - 1)
+    part = np.partition(returns, [k, hi])
+    a, b = part[k], part[hi]
+    var = b - (b - a) * (1 - t) if t >= 0.5 else a + (b - a) * t
+    tail = part[:k + 1]
+    if hi > k and b <= var:
+        # Ties with the VaR right of the pivot also belong to the tail
+        rest = part[hi:]
+        tail = np.concatenate((tail, rest[rest <= var]))
+    return float(var), float(np.mean(tail))
+
+
+if _HAS_NUMBA:
+    @njit(cache=True)
+    def _return_stats_kernel(eq):
+        """Same results as _return_stats_numpy in one pass over ``eq`` (the
+        means and variances are accumulated with Welford's method)."""
+        n = len(eq) - 1
+        daily_returns = np.empty(n)
+        mean = 0.0
+        m2 = 0.0
+        down_n = 0
+        down_mean = 0.0
+        down_m2 = 0.0
+        peak = eq[0]
+        max_dd = (peak - eq[0]) / peak
+        for i in range(n):
+            r = (eq[i + 1] - eq[i]) / eq[i]
+            daily_returns[i] = r
+            delta = r - mean
+            mean += delta / (i + 1)
+            m2 += delta * (r - mean)
+            if r < 0:
+                down_n += 1
+                delta = r - down_mean
+                down_mean += delta / down_n
+                down_m2 += delta * (r - down_mean)
+            if eq[i + 1] > peak:
+                peak = eq[i + 1]
+            dd = (peak - eq[i + 1]) / peak
+            if dd > max_dd:
+                max_dd = dd
+        std = np.sqrt(m2 / n) if n > 0 else 0.0
+        downside_std = np.sqrt(down_m2 / down_n) if down_n > 0 else 0.0
+        return daily_returns, mean, std, max_dd, downside_std
@@ -11,6 +11,14 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Optional: Numba compiles the per-simulation metrics into one fused,
+# multi-threaded loop; without it the batch runs as 2-D NumPy operations.
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
 
 def run_monte_carlo(
     trade_returns: list,
@@ -49,19 +57,14 @@ def run_monte_carlo(
     arr = np.array(trade_returns, dtype=float)
     n_trades = len(arr)
 
-    sim_total_returns = np.empty(n_simulations)
-    sim_max_dds       = np.empty(n_simulations)
-    sim_sharpes       = np.empty(n_simulations)
-    sim_final_values  = np.empty(n_simulations)
-
-    for i in range(n_simulations):
-        shuffled = rng.permutation(arr)
-        equity   = _build_equity_curve(shuffled, initial_capital)
+    # One row per simulation, every row shuffled in place by a single call
+    shuffled = np.tile(arr, (n_simulations, 1))
+    rng.permuted(shuffled, axis=1, out=shuffled)
 
-        sim_total_returns[i] = (equity[-1] - equity[0]) / equity[0]
-        sim_max_dds[i]       = _max_drawdown(equity)
-        sim_sharpes[i]       = _sharpe(equity)
-        sim_final_values[i]  = equity[-1]
+    simulate = _simulate_kernel if _HAS_NUMBA else _simulate_numpy
+    sim_total_returns, sim_max_dds, sim_sharpes, sim_final_values = simulate(
+        shuffled, float(initial_capital), 0.04,
+    )
 
     pcts = [5, 25, 50, 75, 95]
     result = {
@@ -87,41 +90,86 @@ def run_monte_carlo(
 
 # ── Internal helpers ──────────────────────────────────────────────────
 
-def _build_equity_curve(pnl_arr: np.ndarray, initial: float) -> np.ndarray:
-    """Cumulative equity curve from a trade P&L array."""
-    equity = np.empty(len(pnl_arr) + 1)
-    equity[0] = initial
-    np.cumsum(pnl_arr, out=equity[1:])
-    equity[1:] += initial
-    return equity
-
-
-def _max_drawdown(equity: np.ndarray) -> float:
-    """Peak-to-trough max drawdown of an equity curve."""
-    peak = np.maximum.accumulate(equity)
-    with np.errstate(divide="ignore", invalid="ignore"):
-        dd = np.where(peak > 0, (peak - equity) / peak, 0.0)
-    return float(np.max(dd))
-
+if _HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _simulate_kernel(shuffled, initial, rf):
+        """Per-simulation total return, max drawdown, Sharpe and final value.
+
+        Same results as _simulate_numpy, but one pass over each shuffled P&L
+        row with no intermediate arrays (the return mean and variance are
+        accumulated with Welford's method).
+        """
+        n_sims, n_trades = shuffled.shape
+        total_returns = np.empty(n_sims)
+        max_dds       = np.empty(n_sims)
+        sharpes       = np.empty(n_sims)
+        final_values  = np.empty(n_sims)
+
+        for i in prange(n_sims):
+            cum = 0.0
+            prev = initial
+            peak = initial
+            max_dd = 0.0
+            mean = 0.0
+            m2 = 0.0
+            for k in range(n_trades):
+                cum += shuffled[i, k]
+                equity = cum + initial
+                if equity > peak:
+                    peak = equity
+                if peak > 0:
+                    dd = (peak - equity) / peak
+                    if dd > max_dd:
+                        max_dd = dd
+                ret = (equity - prev) / prev if prev != 0 else 0.0
+                delta = ret - mean
+                mean += delta / (k + 1)
+                m2 += delta * (ret - mean)
+                prev = equity
+
+            std = np.sqrt(m2 / n_trades)
+            total_returns[i] = (prev - initial) / initial
+            max_dds[i] = max_dd
+            sharpes[i] = 0.0 if std < 1e-12 else (mean - rf / 252) / std * np.sqrt(252)
+            final_values[i] = prev
+
+        return total_returns, max_dds, sharpes, final_values
+
+
+def _simulate_numpy(shuffled: np.ndarray, initial: float, rf: float) -> tuple:
+    """Per-simulation total return, max drawdown, Sharpe and final value.
+
+    All simulations at once: each row of ``shuffled`` is one trade order,
+    and every step below runs along axis 1 over the whole batch.
+    """
+    n_sims, n_trades = shuffled.shape
+    equity = np.empty((n_sims, n_trades + 1))
+    equity[:, 0] = initial
+    np.cumsum(shuffled, axis=1, out=equity[:, 1:])
+    equity[:, 1:] += initial
 
-def _sharpe(equity: np.ndarray, rf: float = 0.04) -> float:
-    """Annualised Sharpe ratio (assuming daily bars, rf = 4 %)."""
-    if len(equity) < 2:
-        return 0.0
+    peak = np.maximum.accumulate(equity, axis=1)
     with np.errstate(divide="ignore", invalid="ignore"):
+        max_dds = np.where(peak > 0, (peak - equity) / peak, 0.0).max(axis=1)
         daily_ret = np.where(
-            equity[:-1] != 0,
-            np.diff(equity) / equity[:-1],
+            equity[:, :-1] != 0,
+            np.diff(equity, axis=1) / equity[:, :-1],
             0.0,
         )
-    std = float(np.std(daily_ret))
-    if std < 1e-12:
-        return 0.0
-    return float((np.mean(daily_ret) - rf / 252) / std * np.sqrt(252))
+        std = daily_ret.std(axis=1)
+        sharpes = np.where(
+            std < 1e-12, 0.0,
+            (daily_ret.mean(axis=1) - rf / 252) / std * np.sqrt(252),
+        )
+
+    total_returns = (equity[:, -1] - initial) / initial
+    return total_returns, max_dds, sharpes, equity[:, -1].copy()
 
 
 def _pct_dict(arr: np.ndarray, percentiles: list) -> dict:
-    return {f"p{p}": round(float(np.percentile(arr, p)), 4) for p in percentiles}
+    # One call partitions around every requested percentile at once
+    values = np.percentile(arr, percentiles)
+    return {f"p{p}": round(float(v), 4) for p, v in zip(percentiles, values)}
 
 
 def _empty_result() -> dict:
@@ -9,6 +9,7 @@ be tested with in-memory lists instead of a real database.
 """
 
 import logging
+from contextlib import nullcontext
 from datetime import datetime
 from typing import Callable
 
@@ -45,6 +46,10 @@ def _default_reset():
     from db.models import reset_paper_portfolio
     return reset_paper_portfolio()
 
+def _default_transaction():
+    from db.database import transaction
+    return transaction()
+
 
 class PaperTrader:
     """Virtual portfolio that auto-executes AI signals on paper.
@@ -60,6 +65,9 @@ class PaperTrader:
         add_trade_fn:      Injected function — logs a trade.
         get_trades_fn:     Injected function — returns list of trade dicts.
         reset_fn:          Injected function — wipes all positions and trades.
+        transaction_fn:    Injected context-manager factory grouping the DB calls of
+                           one operation (defaults to a single DB transaction, or
+                           a no-op when any accessor above is injected).
     """
 
     def __init__(
@@ -74,6 +82,7 @@ class PaperTrader:
         add_trade_fn: Callable | None = None,
         get_trades_fn: Callable | None = None,
         reset_fn: Callable | None = None,
+        transaction_fn: Callable | None = None,
     ):
         self.initial_capital = initial_capital
         self.position_size_pct = position_size_pct
@@ -88,6 +97,12 @@ class PaperTrader:
         self._get_trades     = get_trades_fn     or _default_get_trades
         self._reset          = reset_fn          or _default_reset
 
+        injected = any(fn is not None for fn in (
+            get_positions_fn, open_position_fn, update_position_fn,
+            close_position_fn, add_trade_fn, get_trades_fn, reset_fn,
+        ))
+        self._transaction = transaction_fn or (nullcontext if injected else _default_transaction)
+
     # ── Public API ────────────────────────────────────────────────────
 
     def process_signal(
@@ -113,51 +128,53 @@ class PaperTrader:
         strength   = float(signal.get("strength", 0))
         confidence = float(signal.get("confidence", 0))
 
-        open_positions = self._get_positions("open")
-        open_symbols   = {p["symbol"] for p in open_positions}
-
-        # ── BUY ──────────────────────────────────────────────────────
-        if (direction == "BUY"
-                and strength >= BUY_THRESHOLD
-                and confidence >= BUY_CONFIDENCE_MIN
-                and symbol not in open_symbols):
-
-            portfolio_val = self.get_portfolio_value({symbol: current_price})
-            pos_value = portfolio_val * self.position_size_pct
-            quantity  = pos_value / current_price
-
-            cost = quantity * current_price * (1 + self.commission)
-            cash = self._available_cash()
-            if cost > cash:
-                logger.info("Paper BUY skipped for %s — insufficient cash (%.0f < %.0f)",
-                            symbol, cash, cost)
-                return None
-
-            # ATR-based stop-loss; fall back to 5 % fixed
-            if atr and atr > 0:
-                stop = current_price - STOP_LOSS["atr_multiplier"] * atr
-            else:
-                stop = current_price * (1 - 0.05)
-
-            self._open_position(symbol, current_price, quantity, stop)
-            self._add_trade(symbol, "BUY", current_price, quantity, 0,
-                            f"Signal BUY (str={strength:.2f} conf={confidence:.2f})")
-            logger.info("Paper BUY  %s @ %.4f  qty=%.4f  stop=%.4f",
-                        symbol, current_price, quantity, stop)
-            return "BUY"
-
-        # ── SELL ─────────────────────────────────────────────────────
-        if direction == "SELL" and symbol in open_symbols:
-            pos = next(p for p in open_positions if p["symbol"] == symbol)
-            pnl = (current_price - pos["entry_price"]) * pos["quantity"]
-            pnl -= pos["quantity"] * current_price * self.commission
-            self._close_position(pos["id"], current_price, pnl)
-            self._add_trade(symbol, "SELL", current_price, pos["quantity"], pnl,
-                            f"Signal SELL (str={strength:.2f})")
-            logger.info("Paper SELL %s @ %.4f  pnl=%.2f", symbol, current_price, pnl)
-            return "SELL"
-
-        return None
+        # Position and trade writes commit together
+        with self._transaction():
+            open_positions = self._get_positions("open")
+            open_symbols   = {p["symbol"] for p in open_positions}
+
+            # ── BUY ──────────────────────────────────────────────────
+            if (direction == "BUY"
+                    and strength >= BUY_THRESHOLD
+                    and confidence >= BUY_CONFIDENCE_MIN
+                    and symbol not in open_symbols):
+
+                portfolio_val = self.get_portfolio_value({symbol: current_price})
+                pos_value = portfolio_val * self.position_size_pct
+                quantity  = pos_value / current_price
+
+                cost = quantity * current_price * (1 + self.commission)
+                cash = self._available_cash()
+                if cost > cash:
+                    logger.info("Paper BUY skipped for %s — insufficient cash (%.0f < %.0f)",
+                                symbol, cash, cost)
+                    return None
+
+                # ATR-based stop-loss; fall back to 5 % fixed
+                if atr and atr > 0:
+                    stop = current_price - STOP_LOSS["atr_multiplier"] * atr
+                else:
+                    stop = current_price * (1 - 0.05)
+
+                self._open_position(symbol, current_price, quantity, stop)
+                self._add_trade(symbol, "BUY", current_price, quantity, 0,
+                                f"Signal BUY (str={strength:.2f} conf={confidence:.2f})")
+                logger.info("Paper BUY  %s @ %.4f  qty=%.4f  stop=%.4f",
+                            symbol, current_price, quantity, stop)
+                return "BUY"
+
+            # ── SELL ─────────────────────────────────────────────────
+            if direction == "SELL" and symbol in open_symbols:
+                pos = next(p for p in open_positions if p["symbol"] == symbol)
+                pnl = (current_price - pos["entry_price"]) * pos["quantity"]
+                pnl -= pos["quantity"] * current_price * self.commission
+                self._close_position(pos["id"], current_price, pnl)
+                self._add_trade(symbol, "SELL", current_price, pos["quantity"], pnl,
+                                f"Signal SELL (str={strength:.2f})")
+                logger.info("Paper SELL %s @ %.4f  pnl=%.2f", symbol, current_price, pnl)
+                return "SELL"
+
+            return None
 
     def update_positions(self, current_prices: dict) -> list[dict]:
         """Check stop-losses and update trailing stops for open positions.
@@ -168,37 +185,39 @@ class PaperTrader:
         Returns:
             List of positions that were stopped out.
         """
-        stopped = []
-        for pos in self._get_positions("open"):
-            sym   = pos["symbol"]
-            price = current_prices.get(sym)
-            if price is None:
-                continue
-
-            # Update trailing stop if price made a new high
-            high = pos.get("highest_price") or pos["entry_price"]
-            if price > high:
-                new_trail = price * (1 - STOP_LOSS["trailing"])
-                self._update_position(pos["id"],
-                                      highest_price=price,
-                                      trailing_stop=new_trail)
-
-            # Evaluate effective stop
-            effective_stop = max(
-                pos.get("stop_loss")    or 0,
-                pos.get("trailing_stop") or 0,
-            )
-            if effective_stop > 0 and price <= effective_stop:
-                pnl = (price - pos["entry_price"]) * pos["quantity"]
-                pnl -= pos["quantity"] * price * self.commission
-                self._close_position(pos["id"], price, pnl)
-                self._add_trade(sym, "STOP", price, pos["quantity"], pnl,
-                                f"Stop-loss triggered @ {effective_stop:.4f}")
-                stopped.append({**pos, "close_price": price, "pnl": pnl})
-                logger.info("Paper STOP %s @ %.4f  stop=%.4f  pnl=%.2f",
-                            sym, price, effective_stop, pnl)
-
-        return stopped
+        # One commit for all trailing-stop updates and stop-outs
+        with self._transaction():
+            stopped = []
+            for pos in self._get_positions("open"):
+                sym   = pos["symbol"]
+                price = current_prices.get(sym)
+                if price is None:
+                    continue
+
+                # Update trailing stop if price made a new high
+                high = pos.get("highest_price") or pos["entry_price"]
+                if price > high:
+                    new_trail = price * (1 - STOP_LOSS["trailing"])
+                    self._update_position(pos["id"],
+                                          highest_price=price,
+                                          trailing_stop=new_trail)
+
+                # Evaluate effective stop
+                effective_stop = max(
+                    pos.get("stop_loss")    or 0,
+                    pos.get("trailing_stop") or 0,
+                )
+                if effective_stop > 0 and price <= effective_stop:
+                    pnl = (price - pos["entry_price"]) * pos["quantity"]
+                    pnl -= pos["quantity"] * price * self.commission
+                    self._close_position(pos["id"], price, pnl)
+                    self._add_trade(sym, "STOP", price, pos["quantity"], pnl,
+                                    f"Stop-loss triggered @ {effective_stop:.4f}")
+                    stopped.append({**pos, "close_price": price, "pnl": pnl})
+                    logger.info("Paper STOP %s @ %.4f  stop=%.4f  pnl=%.2f",
+                                sym, price, effective_stop, pnl)
+
+            return stopped
 
     def get_portfolio_summary(self, current_prices: dict | None = None) -> dict:
         """Return a snapshot of the virtual portfolio.
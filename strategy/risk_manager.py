@@ -36,7 +36,7 @@ def check_position_limits(symbol: str, proposed_value: float,
         else:
             # Fallback: use cost basis from DB (conservative for losing positions,
             # but may understate exposure for appreciated holdings)
-            holdings = get_holdings()
+            holdings = get_holdings(columns=("asset_type", "quantity", "avg_cost"))
             crypto_value = sum(h["quantity"] * h["avg_cost"] for h in holdings
                                if h.get("asset_type") == "crypto")
         new_crypto_pct = (crypto_value + proposed_value) / portfolio_value
@@ -7,7 +7,9 @@ successive unseen data periods.
 """
 
 import logging
+from functools import reduce
 import numpy as np
+import pandas as pd
 
 logger = logging.getLogger(__name__)
 
@@ -65,9 +67,10 @@ class WalkForwardValidator:
         from strategy.backtester import BacktestEngine
 
         # Build sorted union of all dates across all symbols
-        all_dates = sorted(
-            {d for df in price_data.values() for d in df.index}
-        )
+        all_dates = pd.DatetimeIndex(reduce(
+            np.union1d, (df.index.values for df in price_data.values()),
+            np.array([], dtype="datetime64[ns]"),
+        ))
         total_bars = len(all_dates)
 
         folds: list[dict] = []
@@ -76,12 +79,13 @@ class WalkForwardValidator:
 
         while oos_end <= total_bars:
             oos_start_idx = oos_end - self.out_of_sample_bars
-            window_dates = set(all_dates[:oos_end])
+            window_end = all_dates[oos_end - 1]
 
-            # Slice each symbol's data to the current window
+            # Slice each symbol's data to the current window; each index is
+            # sorted, so the window is a prefix found by binary search.
             window_data: dict = {}
             for sym, df in price_data.items():
-                sliced = df[df.index.isin(window_dates)]
+                sliced = df.iloc[:df.index.searchsorted(window_end, side="right")]
                 if len(sliced) >= self.in_sample_bars + 10:
                     window_data[sym] = sliced
 
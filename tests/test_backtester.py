@@ -7,6 +7,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 import pytest
 import pandas as pd
 import numpy as np
+from strategy import backtester
 from strategy.backtester import BacktestEngine
 
 
@@ -91,3 +92,54 @@ def test_backtest_single_asset():
     engine = BacktestEngine()
     results = engine.run(data)
     assert "total_return" in results
+
+
+def test_benchmark_staggered_start_and_gaps():
+    """Late-listed symbols are held as cash until their first bar; gaps carry forward."""
+    dates = pd.date_range("2022-01-03", periods=6, freq="B")
+    a = pd.DataFrame({"close": [10.0, 11, 12, 13, 14, 15]}, index=dates)
+    b = pd.DataFrame({"close": [20.0, 30, 40]}, index=dates[[2, 3, 5]])
+
+    engine = BacktestEngine(initial_capital=1000)
+    close_mat = np.column_stack([
+        a["close"].reindex(dates).to_numpy(), b["close"].reindex(dates).to_numpy(),
+    ])
+    bench = engine._compute_benchmark(close_mat)
+
+    assert bench[0] == pytest.approx(1000)
+    # dates[4]: A at 14 (50 shares), B missing -> last close 30 (25 shares)
+    assert bench[4] == pytest.approx(50 * 14 + 25 * 30)
+    assert bench[-1] == pytest.approx(50 * 15 + 25 * 40)
+
+
+def test_precomputed_signals_match_per_bar_signals(price_data):
+    from analysis.technical import compute_technical_signal
+    engine = BacktestEngine()
+    dates = price_data["AAPL"].index
+    score_mat, conf_mat = engine._precompute_signals(price_data, dates)
+    assert np.isnan(score_mat[:200]).all()
+    for j, sym in enumerate(price_data):
+        for i in (200, 250, 299):
+            sig = compute_technical_signal(price_data[sym].iloc[:i + 1])
+            assert score_mat[i, j] == sig["score"]
+            assert conf_mat[i, j] == sig["confidence"]
+
+
+@pytest.mark.skipif(not backtester._HAS_NUMBA, reason="numba not installed")
+def test_return_stats_kernel_matches_numpy():
+    eq = 100_000 * np.cumprod(1 + np.random.default_rng(0).normal(0, 0.01, 500))
+    expected = backtester._return_stats_numpy(eq)
+    actual = backtester._return_stats_kernel(eq)
+    for exp, act in zip(expected, actual):
+        np.testing.assert_allclose(act, exp, rtol=1e-9)
+
+
+def test_var_cvar_matches_percentile_with_ties():
+    rng = np.random.default_rng(1)
+    for n in (1, 2, 21, 250):
+        returns = rng.normal(0, 0.01, n)
+        returns[rng.random(n) < 0.6] = 0.0  # flat days tie with the VaR
+        var = np.percentile(returns, 5)
+        var_95, cvar_95 = backtester._var_cvar(returns, 5)
+        assert var_95 == var
+        assert cvar_95 == pytest.approx(np.mean(returns[returns <= var]), abs=1e-15)
@@ -13,8 +13,8 @@ from datetime import datetime
 @pytest.fixture(autouse=True)
 def init_db():
     """Ensure database exists before tests."""
-    from db.database import init_db
-    init_db()
+    from db.database import ensure_schema
+    ensure_schema()
 
 
 @pytest.fixture
@@ -39,6 +39,19 @@ def test_cache_and_retrieve_price(sample_df):
     assert "close" in cached.columns
 
 
+def test_stale_price_cache_only_with_allow_stale(sample_df):
+    from data.cache_manager import cache_price_data, get_cached_price_data
+    from db.database import get_db
+    cache_price_data("STALE_SYM", sample_df, "stock")
+    with get_db() as conn:
+        conn.execute("UPDATE price_cache SET fetched_at=datetime('now', '-1 day') "
+                     "WHERE symbol='STALE_SYM'")
+    assert get_cached_price_data("STALE_SYM", "stock") is None
+    cached = get_cached_price_data("STALE_SYM", "stock", allow_stale=True)
+    assert cached is not None
+    assert len(cached) == len(sample_df)
+
+
 def test_cache_returns_none_for_unknown():
     from data.cache_manager import get_cached_price_data
     cached = get_cached_price_data("NONEXISTENT_XYZ", "stock")
@@ -73,3 +86,15 @@ def test_clear_cache():
 def test_clear_all_cache():
     from data.cache_manager import clear_cache
     clear_cache("all")  # Should not raise
+
+
+def test_cache_news_dedupes_repeated_titles():
+    from data.cache_manager import cache_news, get_cached_news
+    articles = [
+        {"title": "Dedupe headline", "description": "Desc", "source": "Test", "url": "", "published_at": "2023-01-01"},
+    ]
+    cache_news("TEST_NEWS_DEDUPE", articles)
+    cache_news("TEST_NEWS_DEDUPE", articles)
+    cached = get_cached_news("TEST_NEWS_DEDUPE")
+    assert cached is not None
+    assert len(cached) == 1
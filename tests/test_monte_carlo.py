@@ -0,0 +1,52 @@
+"""Tests for Monte Carlo trade-shuffle simulation."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+import numpy as np
+from strategy import monte_carlo
+from strategy.monte_carlo import run_monte_carlo
+
+
+@pytest.fixture
+def trade_returns():
+    return list(np.random.RandomState(0).randn(120) * 800 + 50)
+
+
+def test_monte_carlo_structure(trade_returns):
+    result = run_monte_carlo(trade_returns, n_simulations=200)
+    assert result["n_simulations"] == 200
+    assert result["n_trades"] == len(trade_returns)
+    for key in ("total_return", "max_drawdown", "sharpe_ratio", "final_value"):
+        assert set(result[key]) == {"p5", "p25", "p50", "p75", "p95"}
+    assert 0 <= result["prob_positive"] <= 1
+
+
+def test_monte_carlo_order_invariant_final_value(trade_returns):
+    """Shuffling never changes the sum of P&L, so every final value is equal."""
+    result = run_monte_carlo(trade_returns, initial_capital=10_000, n_simulations=100)
+    expected = round(10_000 + sum(trade_returns), 4)
+    assert result["final_value"]["p5"] == pytest.approx(expected)
+    assert result["final_value"]["p95"] == pytest.approx(expected)
+
+
+def test_monte_carlo_seed_reproducible(trade_returns):
+    assert run_monte_carlo(trade_returns, random_seed=7) == run_monte_carlo(trade_returns, random_seed=7)
+
+
+def test_monte_carlo_empty():
+    result = run_monte_carlo([])
+    assert result["n_simulations"] == 0
+    assert result["total_return"] == {}
+
+
+@pytest.mark.skipif(not monte_carlo._HAS_NUMBA, reason="numba not installed")
+def test_numba_kernel_matches_numpy(trade_returns):
+    arr = np.array(trade_returns)
+    shuffled = np.stack([np.random.default_rng(i).permutation(arr) for i in range(20)])
+    expected = monte_carlo._simulate_numpy(shuffled, 100_000.0, 0.04)
+    actual = monte_carlo._simulate_kernel(shuffled, 100_000.0, 0.04)
+    for exp, act in zip(expected, actual):
+        np.testing.assert_allclose(act, exp, rtol=1e-9)
@@ -0,0 +1,88 @@
+"""Tests for news fetcher module."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import json
+
+from data import news_fetcher
+from data.news_fetcher import _dedupe_articles
+
+
+def _art(title):
+    return {"title": title, "description": "", "source": "", "url": "", "published_at": ""}
+
+
+def test_dedupe_drops_punctuation_variants():
+    articles = [
+        _art("Apple beats Q3 earnings expectations"),
+        _art("Apple Beats Q3 Earnings Expectations!"),
+        _art("Tesla recalls 2,000 vehicles"),
+    ]
+    unique = _dedupe_articles(articles)
+    assert [a["title"] for a in unique] == [
+        "Apple beats Q3 earnings expectations",
+        "Tesla recalls 2,000 vehicles",
+    ]
+
+
+def test_dedupe_keeps_distinct_stories():
+    articles = [_art("Fed holds rates steady"), _art("Fed signals rate cut in December")]
+    assert len(_dedupe_articles(articles)) == 2
+
+
+def test_dedupe_skips_empty_titles():
+    assert _dedupe_articles([_art(""), _art("   ")]) == []
+
+
+class _Resp:
+    def __init__(self, items):
+        self.content = json.dumps({"data": items}).encode()
+
+
+def _item(sym, i):
+    return {"title": f"{sym} story {i}", "entities": [{"symbol": sym}]}
+
+
+def _fake_marketaux(monkeypatch, crowd_with=None):
+    """Route MarketAux requests to a fake; returns the list of requests made."""
+    calls = []
+
+    def fake_request(url, params, timeout=10):
+        syms = params["symbols"].split(",")
+        calls.append((syms, params["limit"]))
+        if crowd_with and len(syms) > 1:
+            # A heavily covered ticker fills the whole batch response
+            return _Resp([_item(crowd_with, i) for i in range(params["limit"])])
+        return _Resp([_item(syms[i % len(syms)], i) for i in range(params["limit"])])
+
+    monkeypatch.setattr(news_fetcher, "MARKETAUX_API_KEY", "test")
+    monkeypatch.setattr(news_fetcher, "_request_with_retry", fake_request)
+    monkeypatch.setattr(news_fetcher._marketaux_limiter, "acquire", lambda: None)
+    return calls
+
+
+def test_marketaux_batches_symbols_with_configured_cap(monkeypatch):
+    calls = _fake_marketaux(monkeypatch)
+    cap = news_fetcher.RATE_LIMITS["marketaux_articles_per_request"]
+    symbols = ["AAPL", "MSFT", "TSLA", "NVDA", "AMZN", "META"]
+
+    news = news_fetcher.fetch_marketaux_news_batch(symbols)
+
+    assert len(calls) < len(symbols)
+    assert all(len(syms) > 1 and limit <= cap for syms, limit in calls)
+    assert sorted(sym for syms, _ in calls for sym in syms) == sorted(symbols)
+    assert set(news) == set(symbols)
+
+
+def test_marketaux_batch_refetches_crowded_out_symbols(monkeypatch):
+    calls = _fake_marketaux(monkeypatch, crowd_with="AAPL")
+
+    news = news_fetcher.fetch_marketaux_news_batch(["AAPL", "MSFT", "TSLA"])
+
+    assert calls[0][0] == ["AAPL", "MSFT", "TSLA"]
+    assert sorted(syms[0] for syms, _ in calls[1:]) == ["MSFT", "TSLA"]
+    assert news["AAPL"]
+    assert news["MSFT"][0]["title"] == "MSFT story 0"
+    assert news["TSLA"][0]["title"] == "TSLA story 0"
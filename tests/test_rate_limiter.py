@@ -0,0 +1,43 @@
+"""Tests for the token-bucket rate limiter."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from data.rate_limiter import RateLimiter
+
+
+def test_try_acquire_exhausts_bucket():
+    limiter = RateLimiter(3, 60)
+    assert all(limiter.try_acquire() for _ in range(3))
+    assert limiter.try_acquire() is False
+
+
+def test_acquire_blocks_until_refill():
+    limiter = RateLimiter(1, 0.2)
+    limiter.acquire()
+    start = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - start >= 0.15
+
+
+def test_acquire_concurrent_waiters_all_proceed():
+    limiter = RateLimiter(2, 0.2)  # 10 tokens/s
+    done = []
+
+    def worker():
+        limiter.acquire()
+        done.append(time.monotonic())
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join(timeout=5)
+
+    assert len(done) == 6
+    # 2 immediate tokens + 4 refilled at 10/s → at least ~0.4s total
+    assert max(done) - start >= 0.35
@@ -11,6 +11,13 @@ from strategy.risk_manager import (
 )
 
 
+@pytest.fixture(autouse=True)
+def init_db():
+    """Drawdown checks record risk alerts, so the schema must exist."""
+    from db.database import ensure_schema
+    ensure_schema()
+
+
 def test_position_limits_within():
     result = check_position_limits("AAPL", 10000, 100000, "stock")
     assert result["allowed"] is True